@@ -55,22 +55,20 @@ describe("Tools Configuration", () => {
 		expect(SKILL_TOOLS).toContain("Skill");
 	});
 
-	test("getBuiltinTools returns copy of array", () => {
+	test("getBuiltinTools returns the shared builtin tool list", () => {
 		const tools = getBuiltinTools();
+		expect(tools).toBe(BUILTIN_TOOLS);
 		expect(tools).toEqual([...BUILTIN_TOOLS]);
-		// Modifying returned array shouldn't affect original
-		tools.push("NewTool");
-		expect(BUILTIN_TOOLS).not.toContain("NewTool");
 	});
 
-	test("getChromeDevtoolsTools returns copy of array", () => {
+	test("getChromeDevtoolsTools returns the shared tool list", () => {
 		const tools = getChromeDevtoolsTools();
-		expect(tools.length).toBe(CHROME_DEVTOOLS_TOOLS.length);
+		expect(tools).toBe(CHROME_DEVTOOLS_TOOLS);
 	});
 
-	test("getSkillTools returns copy of array", () => {
+	test("getSkillTools returns the shared tool list", () => {
 		const tools = getSkillTools();
-		expect(tools).toEqual([...SKILL_TOOLS]);
+		expect(tools).toBe(SKILL_TOOLS);
 	});
 
 	test("getAllAllowedTools combines all tools", () => {
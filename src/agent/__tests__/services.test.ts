@@ -213,9 +213,11 @@ describe("Progress Service", () => {
 });
 
 describe("Pricing Service", () => {
-	test("PricingCalculator.getFallbackRates returns rates for known models", () => {
-		const calculator = new PricingCalculator();
+	// PricingCalculator is stateless for these lookups; share one instance
+	// across the block instead of re-initializing it per test
+	const calculator = new PricingCalculator();
 
+	test("PricingCalculator.getFallbackRates returns rates for known models", () => {
 		const sonnetRates = calculator.getFallbackRates(
 			"claude-sonnet-4-5-20250929",
 		);
@@ -228,8 +230,6 @@ describe("Pricing Service", () => {
 	});
 
 	test("PricingCalculator.getFallbackRates handles AWS Bedrock model IDs", () => {
-		const calculator = new PricingCalculator();
-
 		const rates = calculator.getFallbackRates(
 			"us.anthropic.claude-sonnet-4-5-20250929-v1:0",
 		);
@@ -238,16 +238,12 @@ describe("Pricing Service", () => {
 	});
 
 	test("PricingCalculator.getFallbackRates returns default for unknown models", () => {
-		const calculator = new PricingCalculator();
-
 		const rates = calculator.getFallbackRates("unknown-model");
 		// Should default to Sonnet 4.5 rates
 		expect(rates.inputRate).toBe(3.0);
 	});
 
 	test("PricingCalculator.calculateCost calculates correctly", () => {
-		const calculator = new PricingCalculator();
-
 		const costs = calculator.calculateCost(
 			{
 				inputTokens: 1000000, // 1M tokens
@@ -266,8 +262,6 @@ describe("Pricing Service", () => {
 	});
 
 	test("PricingCalculator.calculateCost handles cache tokens", () => {
-		const calculator = new PricingCalculator();
-
 		const costs = calculator.calculateCost(
 			{
 				inputTokens: 0,
@@ -285,8 +279,6 @@ describe("Pricing Service", () => {
 	});
 
 	test("PricingCalculator.calculateCost strips context window suffix from model ID", () => {
-		const calculator = new PricingCalculator();
-
 		// Model ID with [1m] suffix (1 million context window)
 		const costsWithSuffix = calculator.calculateCost(
 			{
@@ -6,11 +6,18 @@
  * Uses Claude Agent SDK to execute test planning and test execution sessions.
  */
 
-import { existsSync, mkdirSync, readFileSync, writeFileSync } from "node:fs";
+import { createHash } from "node:crypto";
+import { existsSync, mkdirSync } from "node:fs";
+import { readFile, rename, writeFile } from "node:fs/promises";
 import { join } from "node:path";
+import type { Options as SDKOptions } from "@anthropic-ai/claude-agent-sdk";
 import { createSdkOptions } from "./client.ts";
 import type { AgentOptions } from "./config.ts";
-import { AUTO_CONTINUE_DELAY_MS, DEFAULT_MODEL } from "./config.ts";
+import {
+	AUTO_CONTINUE_DELAY_MS,
+	DEFAULT_MODEL,
+	ISOLATE_SESSION_CACHE,
+} from "./config.ts";
 import {
 	getResumeResetPrompt,
 	getTestExecutorPrompt,
@@ -24,7 +31,7 @@ import {
 	TokenUsageTracker,
 	updateSessionState,
 } from "./services/index.ts";
-import { PricingCalculator } from "./services/pricing.ts";
+import { getDefaultPricingCalculator } from "./services/pricing.ts";
 import { runAgentSession } from "./session.ts";
 import { SessionStatus } from "./types/index.ts";
 import { sleep } from "./utils/index.ts";
@@ -77,31 +84,44 @@ function escapeHtml(str: string): string {
 
 const SEPARATOR_WIDTH = 70;
 
+// Hoisted loop invariants: these strings are printed every iteration, so
+// build them once at module load instead of re-repeating per call
+const SECTION_SEPARATOR = "=".repeat(SEPARATOR_WIDTH);
+const SUBSECTION_SEPARATOR = "-".repeat(SEPARATOR_WIDTH);
+const AUTO_CONTINUE_MESSAGE = `\nAgent will auto-continue in ${AUTO_CONTINUE_DELAY_MS / 1000}s...`;
+
 /**
  * Print a section header with double-line separators (=)
  */
 function printSectionHeader(title: string): void {
-	console.log(`\n${"=".repeat(SEPARATOR_WIDTH)}`);
+	console.log(`\n${SECTION_SEPARATOR}`);
 	console.log(`  ${title}`);
-	console.log("=".repeat(SEPARATOR_WIDTH));
+	console.log(SECTION_SEPARATOR);
 }
 
 /**
  * Print a subsection header with single-line separators (-)
  */
 function printSubsectionHeader(title: string): void {
-	console.log(`\n${"-".repeat(SEPARATOR_WIDTH)}`);
+	console.log(`\n${SUBSECTION_SEPARATOR}`);
 	console.log(`  ${title}`);
-	console.log("-".repeat(SEPARATOR_WIDTH));
+	console.log(SUBSECTION_SEPARATOR);
 }
 
 /**
  * Print a closing separator (=)
  */
 function printSectionFooter(): void {
-	console.log("=".repeat(SEPARATOR_WIDTH));
+	console.log(SECTION_SEPARATOR);
 }
 
+// Matches the entire cost-grid div through the closing card/section tags;
+// compiled once at module load rather than per report update
+// Structure: <div class="cost-grid">..items..</div></div></section>
+// (cost-grid closes, then cost-card closes, then section closes)
+const COST_GRID_PATTERN =
+	/<div class="cost-grid">[\s\S]*?<\/div>\s*<\/div>\s*<\/section>/;
+
 /**
  * Update HTML report with final cost statistics from usage_statistics.json.
  * This is called after the test_report session completes to ensure accurate costs.
@@ -119,7 +139,7 @@ export async function updateHtmlReportCosts(projectDir: string): Promise<void> {
 			return;
 		}
 
-		const usageStats = JSON.parse(readFileSync(usageStatsFile, "utf-8"));
+		const usageStats = JSON.parse(await readFile(usageStatsFile, "utf-8"));
 		const summary = usageStats.summary;
 
 		// Find the latest test-reports directory
@@ -142,7 +162,7 @@ export async function updateHtmlReportCosts(projectDir: string): Promise<void> {
 		}
 
 		// Read HTML content
-		let htmlContent = readFileSync(htmlReportFile, "utf-8");
+		let htmlContent = await readFile(htmlReportFile, "utf-8");
 
 		// Calculate total duration from all sessions
 		const totalDurationMs = usageStats.sessions.reduce(
@@ -178,15 +198,17 @@ export async function updateHtmlReportCosts(projectDir: string): Promise<void> {
                 </div>`;
 
 		// Match the entire cost-grid div and replace it
-		// Structure: <div class="cost-grid">..items..</div></div></section>
-		// (cost-grid closes, then cost-card closes, then section closes)
 		htmlContent = htmlContent.replace(
-			/<div class="cost-grid">[\s\S]*?<\/div>\s*<\/div>\s*<\/section>/,
+			COST_GRID_PATTERN,
 			`${costGridHtml}\n            </div>\n        </section>`,
 		);
 
-		// Write updated HTML
-		writeFileSync(htmlReportFile, htmlContent, "utf-8");
+		// Write updated HTML atomically (write-to-temp + rename) so a crash
+		// mid-write can't leave a truncated report behind, matching the
+		// usage-statistics save path
+		const tempFile = `${htmlReportFile}.tmp`;
+		await writeFile(tempFile, htmlContent, "utf-8");
+		await rename(tempFile, htmlReportFile);
 
 		console.log(`[Report Update] Updated HTML report costs:`);
 		console.log(`  - Total Cost: ${totalCost}`);
@@ -198,6 +220,30 @@ export async function updateHtmlReportCosts(projectDir: string): Promise<void> {
 	}
 }
 
+// ============================================================================
+// Session Kick-off Messages
+// ============================================================================
+
+/**
+ * Short dynamic user messages sent to start each session.
+ *
+ * The large, static planner/executor instructions are passed via
+ * appendSystemPrompt instead, so they land inside the cached system-prompt
+ * prefix (cache reads bill at 0.1x vs 1.0x input). Only these small
+ * per-iteration messages are sent uncached.
+ */
+const PLANNER_KICKOFF_PROMPT =
+	"Begin the test planning session now, following the test planning " +
+	"workflow in your system instructions.";
+
+const EXECUTOR_KICKOFF_PROMPT =
+	"Begin the test execution session now, following the test execution " +
+	"workflow in your system instructions.";
+
+const REPORT_KICKOFF_PROMPT =
+	"Begin the report generation session now, following the report " +
+	"generation workflow in your system instructions.";
+
 // ============================================================================
 // Helper Functions for Agent Loop
 // ============================================================================
@@ -213,7 +259,7 @@ function printAgentBanner(
 	printSectionHeader("AUTONOMOUS TESTING AGENT (TypeScript)");
 	console.log(`\nProject directory: ${projectDir}`);
 	console.log(`Model: ${model}`);
-	if (maxIterations) {
+	if (maxIterations !== null) {
 		console.log(`Max iterations: ${maxIterations}`);
 	} else {
 		console.log("Max iterations: Unlimited (will run until completion)");
@@ -245,11 +291,20 @@ export async function runAutonomousTestingAgent(
 	}
 
 	// Initialize token usage tracking with cache refresh
-	const pricingCalculator = new PricingCalculator();
+	const pricingCalculator = getDefaultPricingCalculator();
 	// Pre-refresh pricing cache if stale (async fetch not possible in sync calculateCost)
 	if (!pricingCalculator.isCacheValid()) {
-		await pricingCalculator.updatePriceCache();
+		if (pricingCalculator.loadCachedPrices()) {
+			// An expired cache exists: serve it stale and refresh off the
+			// hot path instead of blocking startup on the fetch
+			void pricingCalculator.updatePriceCache();
+		} else {
+			await pricingCalculator.updatePriceCache();
+		}
 	}
+	// Keep the cache warm across long runs so later sessions never hit an
+	// expired cache in the foreground
+	pricingCalculator.startBackgroundRefresh();
 	const usageTracker = new TokenUsageTracker(projectDir, pricingCalculator);
 
 	// Check if this is a fresh start or continuation
@@ -274,6 +329,12 @@ export async function runAutonomousTestingAgent(
 	// Initialize progress tracker
 	const progressTracker = new ProgressTracker(projectDir);
 
+	// Resolve the iteration bound once: Infinity for unbounded runs, so the
+	// loop needs a single numeric comparison per pass. Using ?? (not a
+	// truthiness check) also makes --max-iterations 0 stop immediately
+	// instead of running forever.
+	const iterationCap = maxIterations ?? Number.POSITIVE_INFINITY;
+
 	// Main loop
 	let iteration = 0;
 	let allTestsBlocked = false;
@@ -281,12 +342,44 @@ export async function runAutonomousTestingAgent(
 	let consecutiveNoProgress = 0;
 	const MAX_NO_PROGRESS_SESSIONS = 3;
 	let previousNotRunCount: number | null = null;
+	let previousPromptFingerprint: string | null = null;
+
+	// SDK options are expensive to build (AWS credential validation
+	// round-trip, plugin collection, settings write), so build them once per
+	// session type and reuse them across iterations. With
+	// ISOLATE_SESSION_CACHE the system prompt embeds a fresh per-session
+	// UUID, so the cache is bypassed and every iteration rebuilds.
+	const sdkOptionsCache = new Map<string, SDKOptions>();
+
+	const getBaseSdkOptions = async (
+		sessionType: "test_planner" | "test_executor",
+	): Promise<SDKOptions> => {
+		if (!ISOLATE_SESSION_CACHE) {
+			const cached = sdkOptionsCache.get(sessionType);
+			if (cached) {
+				return cached;
+			}
+		}
+		const staticInstructions =
+			sessionType === "test_planner"
+				? await getTestPlannerPrompt()
+				: await getTestExecutorPrompt();
+		const { options: baseOptions } = await createSdkOptions({
+			projectDir,
+			model,
+			appendSystemPrompt: staticInstructions,
+		});
+		if (!ISOLATE_SESSION_CACHE) {
+			sdkOptionsCache.set(sessionType, baseOptions);
+		}
+		return baseOptions;
+	};
 
 	while (true) {
 		iteration++;
 
 		// Check max iterations
-		if (maxIterations && iteration > maxIterations) {
+		if (iteration > iterationCap) {
 			console.log(`\nReached max iterations (${maxIterations})`);
 			console.log("To continue, run the script again without --max-iterations");
 			break;
@@ -319,27 +412,48 @@ export async function runAutonomousTestingAgent(
 			}
 		}
 
-		// Create SDK options with conditional session resume
-		const { options: sdkOptions } = await createSdkOptions({
-			projectDir,
-			model,
-			...(resumeSessionId ? { resumeSessionId } : {}),
-		});
-
-		// Choose prompt based on session type
+		// Choose the dynamic kick-off message for this session type. The
+		// static instructions live in the cached system prompt; the user
+		// message carries only the small dynamic tail (kick-off + resume reset)
 		let prompt: string;
 
 		if (isFirstRun) {
-			prompt = await getTestPlannerPrompt();
+			prompt = PLANNER_KICKOFF_PROMPT;
 			isFirstRun = false;
 		} else {
-			prompt = await getTestExecutorPrompt();
+			prompt = EXECUTOR_KICKOFF_PROMPT;
 			// If resuming, prepend reset instructions to avoid "mission accomplished" trap
 			if (isResumedSession) {
 				prompt = getResumeResetPrompt() + prompt;
 			}
 		}
 
+		// Reuse base SDK options for this session type; only the resume
+		// target varies between iterations
+		const baseOptions = await getBaseSdkOptions(currentSessionType);
+		const sdkOptions: SDKOptions = {
+			...baseOptions,
+			...(resumeSessionId ? { resume: resumeSessionId } : {}),
+		};
+
+		// Prompt caching is prefix-match: a single changed byte in the system
+		// prompt invalidates the whole cache. Fingerprint the cached prefix per
+		// session type and warn on drift (catches accidental non-determinism)
+		const promptFingerprint = createHash("sha256")
+			.update(`${currentSessionType}\n${sdkOptions.systemPrompt ?? ""}`)
+			.digest("hex");
+		if (
+			previousPromptFingerprint !== null &&
+			currentSessionType === "test_executor" &&
+			promptFingerprint !== previousPromptFingerprint
+		) {
+			console.log(
+				"[Prompt Cache] Warning: system prompt changed between iterations — cached prefix will not be reused",
+			);
+		}
+		previousPromptFingerprint =
+			currentSessionType === "test_executor" ? promptFingerprint : null;
+
 		// Create abort controller
 		const abortController = new AbortController();
 
@@ -352,8 +466,13 @@ export async function runAutonomousTestingAgent(
 
 		const { status, usageData } = result;
 
-		// Give processes time to terminate gracefully
-		await sleep(500);
+		// Give processes time to terminate gracefully, and hide the
+		// post-session test count behind the same settle window — the two
+		// touch different resources
+		const [, postSessionStats] = await Promise.all([
+			sleep(500),
+			progressTracker.countTestCases(),
+		]);
 
 		// Record usage statistics if available
 		if (usageData?.usage) {
@@ -377,7 +496,6 @@ export async function runAutonomousTestingAgent(
 
 		// Update session state for conditional resume (executor sessions only)
 		if (currentSessionType === "test_executor" && usageData?.sessionId) {
-			const postSessionStats = await progressTracker.countTestCases();
 			// Map session status to state update values
 			// Note: updateSessionState only accepts "continue" | "context_overflow" | "error"
 			// COMPLETED is mapped to "error" as a safe fallback (shouldn't happen in executor sessions)
@@ -403,13 +521,12 @@ export async function runAutonomousTestingAgent(
 
 		// Handle status
 		if (status === SessionStatus.CONTINUE) {
-			console.log(
-				`\nAgent will auto-continue in ${AUTO_CONTINUE_DELAY_MS / 1000}s...`,
-			);
-			await printTestProgressSummary(projectDir);
+			console.log(AUTO_CONTINUE_MESSAGE);
 
-			// Check if all tests are completed
-			const stats = await progressTracker.countTestCases();
+			// Reuse the post-session count for both the summary and the
+			// completion checks — nothing has written test_cases.json since
+			const stats = postSessionStats;
+			await printTestProgressSummary(projectDir, stats);
 
 			if (stats.notRun === 0 && stats.total > 0) {
 				if (stats.blocked === stats.total) {
@@ -473,18 +590,30 @@ export async function runAutonomousTestingAgent(
 			}
 			previousNotRunCount = stats.notRun;
 
-			await sleep(AUTO_CONTINUE_DELAY_MS);
+			// Overlap the auto-continue delay with warming the next session's
+			// SDK options (the next session is always an executor session), so
+			// first-time option building is off the critical path
+			await Promise.all([
+				sleep(AUTO_CONTINUE_DELAY_MS),
+				getBaseSdkOptions("test_executor"),
+			]);
 		} else if (status === SessionStatus.CONTEXT_OVERFLOW) {
 			console.log("\n[Context Overflow Recovery] Starting fresh session");
-			await sleep(AUTO_CONTINUE_DELAY_MS);
+			await Promise.all([
+				sleep(AUTO_CONTINUE_DELAY_MS),
+				getBaseSdkOptions("test_executor"),
+			]);
 		} else if (status === SessionStatus.ERROR) {
 			console.log("\nSession encountered an error");
 			console.log("Will retry with a fresh session...");
-			await sleep(AUTO_CONTINUE_DELAY_MS);
+			await Promise.all([
+				sleep(AUTO_CONTINUE_DELAY_MS),
+				getBaseSdkOptions("test_executor"),
+			]);
 		}
 
 		// Small delay between sessions
-		if (maxIterations === null || iteration < maxIterations) {
+		if (iteration < iterationCap) {
 			console.log("\nPreparing next session...\n");
 			await sleep(1000);
 		}
@@ -493,22 +622,24 @@ export async function runAutonomousTestingAgent(
 	// Final summary
 	printSectionHeader("TESTING SESSION COMPLETE");
 	console.log(`\nProject directory: ${projectDir}`);
-	await printTestProgressSummary(projectDir);
 
 	// Run report agent to generate final reports (only if tests were executed)
 	const finalStats = await progressTracker.countTestCases();
+	await printTestProgressSummary(projectDir, finalStats);
 	if (finalStats.total > 0 && finalStats.notRun === 0 && !idleLoopDetected) {
 		printSectionHeader("GENERATING FINAL REPORTS");
 
 		try {
-			// Create SDK options for report session
+			// Create SDK options for report session (static instructions cached
+			// in the system prompt, same as planner/executor sessions)
 			const { options: reportSdkOptions } = await createSdkOptions({
 				projectDir,
 				model,
+				appendSystemPrompt: await getTestReportPrompt(),
 			});
 
-			// Get report prompt
-			const reportPrompt = await getTestReportPrompt();
+			// Kick-off message for the report session
+			const reportPrompt = REPORT_KICKOFF_PROMPT;
 
 			// Create abort controller
 			const reportAbortController = new AbortController();
@@ -553,7 +684,7 @@ export async function runAutonomousTestingAgent(
 	printSubsectionHeader("TO VIEW TEST REPORTS:");
 	console.log(`\n  cd ${projectDir}/test-reports`);
 	console.log("  # Open the HTML report viewer in a browser");
-	console.log(`${"-".repeat(SEPARATOR_WIDTH)}`);
+	console.log(SUBSECTION_SEPARATOR);
 
 	console.log("\nDone!");
 
@@ -42,9 +42,12 @@ export function handleAssistantMessage(
 				name: string;
 				input: unknown;
 			};
-			const thinkingTime = (Date.now() - lastEventTime.value) / 1000;
+			// One timestamp per event: reused for both the thinking-time delta
+			// and the tool start marker
+			const now = Date.now();
+			const thinkingTime = (now - lastEventTime.value) / 1000;
 			formatToolUseOutput(toolBlock.name, thinkingTime, toolBlock.input);
-			toolStartTime = Date.now();
+			toolStartTime = now;
 		}
 	}
 
@@ -82,13 +85,14 @@ export function handleUserMessage(
 			}
 
 			const isError = resultBlock.is_error ?? false;
+			const now = Date.now();
 			let executionTime: number | undefined;
 			if (toolStartTime !== null) {
-				executionTime = (Date.now() - toolStartTime) / 1000;
+				executionTime = (now - toolStartTime) / 1000;
 			}
 
 			formatToolResultOutput(contentStr, isError, executionTime);
-			lastEventTime.value = Date.now();
+			lastEventTime.value = now;
 		}
 	}
 }
@@ -73,12 +73,16 @@ export async function truncateLargeToolOutput(
 	const toolName = hookInput.toolName ?? "";
 	const toolResult = hookInput.toolResult ?? {};
 
-	// Get the content from the tool result
-	let content = toolResult.content ?? "";
-	if (typeof content === "object") {
-		content = JSON.stringify(content);
-	} else if (typeof content !== "string") {
-		content = String(content);
+	// Only the content length is needed below, so skip serialization for the
+	// common string case and never retain a serialized copy of object results
+	const rawContent = toolResult.content ?? "";
+	let contentLength: number;
+	if (typeof rawContent === "string") {
+		contentLength = rawContent.length;
+	} else if (typeof rawContent === "object") {
+		contentLength = (JSON.stringify(rawContent) ?? "").length;
+	} else {
+		contentLength = String(rawContent).length;
 	}
 
 	// Determine max length based on tool type
@@ -87,9 +91,9 @@ export async function truncateLargeToolOutput(
 		: MAX_TOOL_OUTPUT_LENGTH;
 
 	// Check if truncation is needed
-	if (content.length > maxLength) {
+	if (contentLength > maxLength) {
 		console.log(
-			`[Hook] Truncating ${toolName} output from ${content.length} to ${maxLength} chars`,
+			`[Hook] Truncating ${toolName} output from ${contentLength} to ${maxLength} chars`,
 		);
 
 		return {
@@ -138,27 +142,33 @@ When compacting context, prioritize:
 	};
 }
 
+// Hook configuration is identical on every call, so build the matcher
+// objects once at module load instead of per SDK-options build
+const CONTEXT_MANAGEMENT_HOOKS: Record<string, HookMatcher[]> = {
+	PostToolUse: [
+		{
+			matcher: "mcp__chrome-devtools__*",
+			hooks: [truncateLargeToolOutput],
+			timeout: 5000,
+		},
+	],
+	PreCompact: [
+		{
+			hooks: [preCompactHandler],
+			timeout: 5000,
+		},
+	],
+};
+
 /**
  * Create hook configuration for context management.
  *
  * @returns Dictionary of hooks to pass to ClaudeAgentOptions
  */
 export function createContextManagementHooks(): Record<string, HookMatcher[]> {
-	return {
-		PostToolUse: [
-			{
-				matcher: "mcp__chrome-devtools__*",
-				hooks: [truncateLargeToolOutput],
-				timeout: 5000,
-			},
-		],
-		PreCompact: [
-			{
-				hooks: [preCompactHandler],
-				timeout: 5000,
-			},
-		],
-	};
+	// Shallow copy so a caller replacing a hook group can't mutate the shared
+	// template; the matcher objects themselves are reused
+	return { ...CONTEXT_MANAGEMENT_HOOKS };
 }
 
 /**
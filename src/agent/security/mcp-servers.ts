@@ -49,6 +49,17 @@ export const DEFAULT_CHROME_ARGS = [
 	"--disable-gpu",
 ] as const;
 
+// Formatted --chromeArg flags for the default Chrome args, built once at
+// module load instead of re-formatting on every config request
+const DEFAULT_CHROMEARG_FLAGS = DEFAULT_CHROME_ARGS.map(
+	(chromeArg) => `--chromeArg=${chromeArg}`,
+);
+
+// Cached all-defaults config: the dominant case rebuilds the identical args
+// list every call, so build it once and hand out copies (callers receive a
+// fresh args array so mutation can't leak into the cache)
+let defaultChromeConfig: McpServerConfig | null = null;
+
 /**
  * Options for Chrome DevTools MCP configuration
  */
@@ -79,6 +90,19 @@ export function getChromeDevtoolsConfig(
 		extraChromeArgs = [],
 	} = options;
 
+	const isDefault =
+		headless &&
+		isolated &&
+		executablePath === CHROME_EXECUTABLE_PATH &&
+		extraChromeArgs.length === 0;
+
+	if (isDefault && defaultChromeConfig) {
+		return {
+			command: defaultChromeConfig.command,
+			args: [...defaultChromeConfig.args],
+		};
+	}
+
 	const args: string[] = ["-y", "chrome-devtools-mcp@latest"];
 
 	if (headless) {
@@ -91,20 +115,24 @@ export function getChromeDevtoolsConfig(
 		args.push("--isolated=true");
 	}
 
-	// Add default Chrome args
-	for (const chromeArg of DEFAULT_CHROME_ARGS) {
-		args.push(`--chromeArg=${chromeArg}`);
-	}
+	// Add default Chrome args (pre-formatted at module load)
+	args.push(...DEFAULT_CHROMEARG_FLAGS);
 
 	// Add extra Chrome args if provided
 	for (const chromeArg of extraChromeArgs) {
 		args.push(`--chromeArg=${chromeArg}`);
 	}
 
-	return {
+	const config: McpServerConfig = {
 		command: "npx",
 		args,
 	};
+
+	if (isDefault) {
+		defaultChromeConfig = { command: config.command, args: [...config.args] };
+	}
+
+	return config;
 }
 
 /**
@@ -124,6 +152,8 @@ export function getDefaultMcpServers(
 	const servers: Record<string, McpServerConfig> = {};
 
 	if (includeChromeDevtools) {
+		// getChromeDevtoolsConfig serves the all-defaults case from its own
+		// cache, so this stays cheap on repeat calls
 		servers["chrome-devtools"] = chromeConfig ?? getChromeDevtoolsConfig();
 	}
 
@@ -59,41 +59,67 @@ export type SkillTool = (typeof SKILL_TOOLS)[number];
 
 /**
  * Get the list of built-in tools
+ *
+ * Returns the shared read-only list; callers that need to mutate it
+ * should spread it into their own array.
  */
-export function getBuiltinTools(): string[] {
-	return [...BUILTIN_TOOLS];
+export function getBuiltinTools(): readonly string[] {
+	return BUILTIN_TOOLS;
 }
 
 /**
  * Get the list of Chrome DevTools MCP tools
  */
-export function getChromeDevtoolsTools(): string[] {
-	return [...CHROME_DEVTOOLS_TOOLS];
+export function getChromeDevtoolsTools(): readonly string[] {
+	return CHROME_DEVTOOLS_TOOLS;
 }
 
 /**
  * Get the list of skill-related tools
  */
-export function getSkillTools(): string[] {
-	return [...SKILL_TOOLS];
+export function getSkillTools(): readonly string[] {
+	return SKILL_TOOLS;
 }
 
+let allAllowedToolsCache: readonly string[] | null = null;
+
 /**
  * Get all tools that should be allowed by default
+ *
+ * The combined list is built once from the immutable source lists and
+ * memoized; subsequent calls return the same read-only array.
  */
-export function getAllAllowedTools(): string[] {
-	return [...BUILTIN_TOOLS, ...CHROME_DEVTOOLS_TOOLS, ...SKILL_TOOLS];
+export function getAllAllowedTools(): readonly string[] {
+	allAllowedToolsCache ??= [
+		...BUILTIN_TOOLS,
+		...CHROME_DEVTOOLS_TOOLS,
+		...SKILL_TOOLS,
+	];
+	return allAllowedToolsCache;
 }
 
+let defaultPermissionsCache: readonly string[] | null = null;
+
 /**
  * Get default permission rules for the security settings
  *
+ * The default-argument result is memoized since it is derived entirely
+ * from module constants; custom tool lists are built fresh.
+ *
  * @param chromeDevtoolsTools - Optional list of Chrome DevTools tools to include
  * @returns List of permission rules
  */
 export function getDefaultPermissions(
 	chromeDevtoolsTools: readonly string[] = CHROME_DEVTOOLS_TOOLS,
-): string[] {
+): readonly string[] {
+	if (chromeDevtoolsTools === CHROME_DEVTOOLS_TOOLS) {
+		defaultPermissionsCache ??= buildPermissions(CHROME_DEVTOOLS_TOOLS);
+		return defaultPermissionsCache;
+	}
+	return buildPermissions(chromeDevtoolsTools);
+}
+
+function buildPermissions(chromeDevtoolsTools: readonly string[]): string[] {
 	return [
 		// Allow all file operations within the project directory
 		"Read(./**)",
@@ -136,7 +162,9 @@ export function createSecuritySettings(_projectDir: string): SecuritySettings {
 		},
 		permissions: {
 			defaultMode: "allow",
-			allow: getDefaultPermissions(CHROME_DEVTOOLS_TOOLS),
+			// Spread so the settings object owns a mutable copy and cannot
+			// corrupt the memoized default list
+			allow: [...getDefaultPermissions(CHROME_DEVTOOLS_TOOLS)],
 		},
 	};
 }
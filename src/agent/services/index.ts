@@ -6,7 +6,7 @@
  */
 
 // Pricing calculator
-export { PricingCalculator } from "./pricing.ts";
+export { getDefaultPricingCalculator, PricingCalculator } from "./pricing.ts";
 
 // Progress tracking utilities
 export {
@@ -6,7 +6,14 @@
  * Implements local caching with 24-hour validity.
  */
 
-import { existsSync, mkdirSync, renameSync } from "node:fs";
+import {
+	existsSync,
+	mkdirSync,
+	readFileSync,
+	renameSync,
+	statSync,
+	writeFileSync,
+} from "node:fs";
 import { homedir } from "node:os";
 import { join } from "node:path";
 import type {
@@ -25,6 +32,97 @@ const DEFAULT_CACHE_DIR = join(homedir(), ".cache", "e2e-agent");
 const CACHE_FILENAME = "litellm_pricing_cache.json";
 const DEFAULT_CACHE_VALIDITY_HOURS = 24;
 
+/**
+ * Keep only the model entries this agent can ever look up.
+ *
+ * The upstream LiteLLM file lists hundreds of providers, but every lookup
+ * here is a Claude model (directly or via a Bedrock-prefixed variant), so
+ * persisting just those entries shrinks the cache file by an order of
+ * magnitude and speeds up every later load and parse. Set
+ * PRICING_CACHE_FULL=1 to persist the unpruned dict.
+ */
+function prunePricingData(
+	pricingData: Record<string, LiteLLMModelPricing>,
+): Record<string, LiteLLMModelPricing> {
+	if (process.env.PRICING_CACHE_FULL === "1") {
+		return pricingData;
+	}
+
+	const pruned: Record<string, LiteLLMModelPricing> = {};
+	for (const [modelId, info] of Object.entries(pricingData)) {
+		if (modelId.includes("claude")) {
+			pruned[modelId] = info;
+		}
+	}
+	return pruned;
+}
+
+// Process-wide default calculator: every consumer that doesn't need a
+// custom cache directory shares one instance, so the pricing cache is
+// parsed (and kept warm) once per process rather than once per tracker
+let defaultCalculator: PricingCalculator | null = null;
+
+/**
+ * Get the shared default-configured PricingCalculator instance.
+ */
+export function getDefaultPricingCalculator(): PricingCalculator {
+	if (!defaultCalculator) {
+		defaultCalculator = new PricingCalculator();
+	}
+	return defaultCalculator;
+}
+
+// Both helpers below are pure string munging over a handful of distinct
+// model IDs per process, so memoize them at module scope; each saved call
+// avoids several string allocations
+const modelVariantsCache = new Map<string, readonly string[]>();
+const baseModelNameCache = new Map<string, string>();
+
+/**
+ * Generate common model ID variants for lookup.
+ */
+function getModelVariants(model: string): readonly string[] {
+	const cached = modelVariantsCache.get(model);
+	if (cached) {
+		return cached;
+	}
+
+	const variants = [model];
+
+	// Remove AWS Bedrock prefix
+	if (model.startsWith("us.anthropic.")) {
+		const base = model.replace("us.anthropic.", "").split("-v")[0];
+		variants.push(base);
+		variants.push(`bedrock/${model}`);
+	}
+
+	if (model.startsWith("anthropic.")) {
+		const base = model.replace("anthropic.", "").split("-v")[0];
+		variants.push(base);
+	}
+
+	modelVariantsCache.set(model, variants);
+	return variants;
+}
+
+/**
+ * Extract base model name from full model ID.
+ */
+function getBaseModelName(model: string): string {
+	const cached = baseModelNameCache.get(model);
+	if (cached !== undefined) {
+		return cached;
+	}
+
+	// Remove provider prefixes, then the version suffix
+	const base = model
+		.replace("us.anthropic.", "")
+		.replace("anthropic.", "")
+		.split("-v")[0];
+	baseModelNameCache.set(model, base);
+	return base;
+}
+
 /**
  * Pricing Calculator class
  *
@@ -34,6 +132,18 @@ export class PricingCalculator {
 	private cacheDir: string;
 	private cacheValidityHours: number;
 	private cacheFile: string;
+	// Extracted per-model rates, keyed by model ID and invalidated when the
+	// cache file's mtime changes; repeat lookups skip the file re-parse
+	private rateCache = new Map<string, PricingRates | null>();
+	private rateCacheMtimeMs = -1;
+	private refreshStarted = false;
+	// Parsed cache file, memoized by mtime and shared between validity
+	// checks and pricing lookups
+	private cachedRead: {
+		mtimeMs: number;
+		fetchedAtMs: number;
+		pricing: Record<string, LiteLLMModelPricing> | null;
+	} | null = null;
 
 	constructor(cacheDir?: string) {
 		this.cacheDir = cacheDir ?? DEFAULT_CACHE_DIR;
@@ -97,12 +207,7 @@ export class PricingCalculator {
 			return null;
 		}
 
-		const cachedPrices = this.loadCachedPrices();
-		if (!cachedPrices) {
-			return null;
-		}
-
-		const rates = this.extractModelRates(cachedPrices, model);
+		const rates = this.getCachedModelRates(model);
 		if (!rates) {
 			return null;
 		}
@@ -196,19 +301,47 @@ export class PricingCalculator {
 
 	/**
 	 * Fetch latest pricing data from LiteLLM GitHub repository.
+	 *
+	 * When validators from a previous fetch are provided, the request is
+	 * conditional: an unchanged upstream file answers 304 with no body
+	 * instead of the full download, signalled here as "not_modified".
 	 */
-	async fetchLatestPrices(): Promise<Record<
-		string,
-		LiteLLMModelPricing
-	> | null> {
+	async fetchLatestPrices(validators?: {
+		etag?: string;
+		lastModified?: string;
+	}): Promise<
+		| {
+				pricing: Record<string, LiteLLMModelPricing>;
+				etag?: string;
+				lastModified?: string;
+		  }
+		| "not_modified"
+		| null
+	> {
 		try {
+			const headers: Record<string, string> = {};
+			if (validators?.etag) {
+				headers["If-None-Match"] = validators.etag;
+			}
+			if (validators?.lastModified) {
+				headers["If-Modified-Since"] = validators.lastModified;
+			}
+
 			const response = await fetch(LITELLM_PRICING_URL, {
+				headers,
 				signal: AbortSignal.timeout(10000),
 			});
+			if (response.status === 304) {
+				return "not_modified";
+			}
 			if (!response.ok) {
 				throw new Error(`HTTP ${response.status}`);
 			}
-			return (await response.json()) as Record<string, LiteLLMModelPricing>;
+			return {
+				pricing: (await response.json()) as Record<string, LiteLLMModelPricing>,
+				etag: response.headers.get("ETag") ?? undefined,
+				lastModified: response.headers.get("Last-Modified") ?? undefined,
+			};
 		} catch (error) {
 			console.log(`[Pricing] Failed to fetch from API: ${error}`);
 			return null;
@@ -217,32 +350,81 @@ export class PricingCalculator {
 
 	/**
 	 * Fetch and cache latest pricing data.
+	 *
+	 * Revalidates with the cached ETag/Last-Modified when available: on a
+	 * 304 only the fetchedAt timestamp is bumped, skipping the body
+	 * download and re-parse entirely.
 	 */
 	async updatePriceCache(): Promise<boolean> {
-		const pricingData = await this.fetchLatestPrices();
-		if (!pricingData) {
+		const cached = this.loadCacheData();
+		const result = await this.fetchLatestPrices({
+			etag: cached?.etag,
+			lastModified: cached?.lastModified,
+		});
+		if (!result) {
 			return false;
 		}
 
-		try {
-			// Add metadata
-			const cacheData: PricingCache = {
+		if (result === "not_modified") {
+			if (!cached) {
+				return false;
+			}
+			const revalidated = this.writeCacheFile({
+				...cached,
 				fetchedAt: Date.now(),
-				sourceUrl: LITELLM_PRICING_URL,
-				pricing: pricingData,
-			};
+			});
+			if (revalidated) {
+				console.log(`[Pricing] Cache revalidated (upstream unchanged)`);
+			}
+			return revalidated;
+		}
+
+		const written = this.writeCacheFile({
+			fetchedAt: Date.now(),
+			sourceUrl: LITELLM_PRICING_URL,
+			etag: result.etag,
+			lastModified: result.lastModified,
+			pricing: prunePricingData(result.pricing),
+		});
+		if (written) {
+			console.log(`[Pricing] Cache updated successfully`);
+		}
+		return written;
+	}
+
+	/**
+	 * Refresh the pricing cache on a timer so foreground callers always
+	 * hit a warm cache instead of stalling on a fetch when it expires.
+	 *
+	 * The timer is unref'd so it never keeps the process alive, and
+	 * repeated calls are no-ops.
+	 */
+	startBackgroundRefresh(intervalHours: number = 12): void {
+		if (this.refreshStarted) {
+			return;
+		}
+		this.refreshStarted = true;
 
-			// Ensure cache directory exists
+		const timer = setInterval(() => {
+			void this.updatePriceCache();
+		}, intervalHours * 3600000);
+		timer.unref?.();
+	}
+
+	/**
+	 * Atomically write the cache file, creating the cache directory if needed.
+	 */
+	private writeCacheFile(cacheData: PricingCache): boolean {
+		try {
 			if (!existsSync(this.cacheDir)) {
 				mkdirSync(this.cacheDir, { recursive: true });
 			}
 
-			// Write to cache file atomically
+			// Compact serialization: the cache is machine-read only, and
+			// indentation inflates the bytes written and re-parsed each cycle
 			const tempFile = `${this.cacheFile}.tmp`;
-			await Bun.write(tempFile, JSON.stringify(cacheData, null, 2));
+			writeFileSync(tempFile, JSON.stringify(cacheData));
 			renameSync(tempFile, this.cacheFile);
-
-			console.log(`[Pricing] Cache updated successfully`);
 			return true;
 		} catch (error) {
 			console.log(`[Pricing] Failed to write cache: ${error}`);
@@ -251,15 +433,42 @@ export class PricingCalculator {
 	}
 
 	/**
-	 * Check if cache exists and is less than cacheValidityHours old.
+	 * Read and parse the full cache file, or null if absent/corrupted.
 	 */
-	isCacheValid(): boolean {
-		if (!existsSync(this.cacheFile)) {
-			return false;
+	private loadCacheData(): (PricingCache & { fetched_at?: number }) | null {
+		try {
+			const content = readFileSync(this.cacheFile, "utf-8");
+			return JSON.parse(content) as PricingCache & { fetched_at?: number };
+		} catch {
+			return null;
+		}
+	}
+
+	/**
+	 * Read the cache file once, memoized by mtime.
+	 *
+	 * Validity checks and pricing lookups both used to parse the full file
+	 * independently; this shares one parse between them and skips it
+	 * entirely while the file is unchanged.
+	 */
+	private readCache(): {
+		mtimeMs: number;
+		fetchedAtMs: number;
+		pricing: Record<string, LiteLLMModelPricing> | null;
+	} | null {
+		let mtimeMs: number;
+		try {
+			mtimeMs = statSync(this.cacheFile).mtimeMs;
+		} catch {
+			return null;
+		}
+
+		if (this.cachedRead && this.cachedRead.mtimeMs === mtimeMs) {
+			return this.cachedRead;
 		}
 
 		try {
-			const content = require("node:fs").readFileSync(this.cacheFile, "utf-8");
+			const content = readFileSync(this.cacheFile, "utf-8");
 			const cacheData = JSON.parse(content) as PricingCache & {
 				fetched_at?: number;
 			};
@@ -271,36 +480,44 @@ export class PricingCalculator {
 			if (fetchedAt > 0 && fetchedAt < 10_000_000_000) {
 				fetchedAt = fetchedAt * 1000;
 			}
-			const ageHours = (Date.now() - fetchedAt) / 3600000;
 
-			return ageHours < this.cacheValidityHours;
+			this.cachedRead = {
+				mtimeMs,
+				fetchedAtMs: fetchedAt,
+				pricing: cacheData.pricing ?? null,
+			};
 		} catch (error) {
 			console.warn(
-				`[Pricing] Failed to validate cache: ${error instanceof Error ? error.message : error}`,
+				`[Pricing] Failed to read cache: ${error instanceof Error ? error.message : error}`,
 			);
 			console.warn(
 				`[Pricing] Cache file may be corrupted. Consider deleting: ${this.cacheFile}`,
 			);
+			// Remember the bad read so an unchanged corrupt file isn't
+			// re-parsed on every call
+			this.cachedRead = { mtimeMs, fetchedAtMs: 0, pricing: null };
+		}
+
+		return this.cachedRead;
+	}
+
+	/**
+	 * Check if cache exists and is less than cacheValidityHours old.
+	 */
+	isCacheValid(): boolean {
+		const cached = this.readCache();
+		if (!cached) {
 			return false;
 		}
+		const ageHours = (Date.now() - cached.fetchedAtMs) / 3600000;
+		return ageHours < this.cacheValidityHours;
 	}
 
 	/**
 	 * Load pricing data from cache file.
 	 */
 	loadCachedPrices(): Record<string, LiteLLMModelPricing> | null {
-		if (!existsSync(this.cacheFile)) {
-			return null;
-		}
-
-		try {
-			const content = require("node:fs").readFileSync(this.cacheFile, "utf-8");
-			const cacheData = JSON.parse(content) as PricingCache;
-			return cacheData.pricing ?? null;
-		} catch (error) {
-			console.log(`[Pricing] Failed to load cache: ${error}`);
-			return null;
-		}
+		return this.readCache()?.pricing ?? null;
 	}
 
 	/**
@@ -313,7 +530,7 @@ export class PricingCalculator {
 		}
 
 		// Try to find base model name
-		const baseModel = this.getBaseModelName(model);
+		const baseModel = getBaseModelName(model);
 		if (baseModel in FALLBACK_PRICING) {
 			return FALLBACK_PRICING[baseModel];
 		}
@@ -325,6 +542,38 @@ export class PricingCalculator {
 		return FALLBACK_PRICING["claude-sonnet-4-5-20250929"];
 	}
 
+	/**
+	 * Look up extracted rates for a model, memoized per cache-file mtime.
+	 *
+	 * Misses (including models absent from the pricing data) are cached
+	 * too, so each model costs at most one parse per cache refresh.
+	 */
+	private getCachedModelRates(model: string): PricingRates | null {
+		let mtimeMs: number;
+		try {
+			mtimeMs = statSync(this.cacheFile).mtimeMs;
+		} catch {
+			return null;
+		}
+
+		if (mtimeMs !== this.rateCacheMtimeMs) {
+			this.rateCache.clear();
+			this.rateCacheMtimeMs = mtimeMs;
+		}
+
+		const cached = this.rateCache.get(model);
+		if (cached !== undefined) {
+			return cached;
+		}
+
+		const cachedPrices = this.loadCachedPrices();
+		const rates = cachedPrices
+			? this.extractModelRates(cachedPrices, model)
+			: null;
+		this.rateCache.set(model, rates);
+		return rates;
+	}
+
 	/**
 	 * Extract rates for a specific model from LiteLLM pricing data.
 	 */
@@ -337,7 +586,7 @@ export class PricingCalculator {
 
 		// Try common variations
 		if (!modelInfo) {
-			for (const variant of this.getModelVariants(model)) {
+			for (const variant of getModelVariants(model)) {
 				modelInfo = pricingData[variant];
 				if (modelInfo) break;
 			}
@@ -361,38 +610,6 @@ export class PricingCalculator {
 		}
 	}
 
-	/**
-	 * Generate common model ID variants for lookup.
-	 */
-	private getModelVariants(model: string): string[] {
-		const variants = [model];
-
-		// Remove AWS Bedrock prefix
-		if (model.startsWith("us.anthropic.")) {
-			const base = model.replace("us.anthropic.", "").split("-v")[0];
-			variants.push(base);
-			variants.push(`bedrock/${model}`);
-		}
-
-		if (model.startsWith("anthropic.")) {
-			const base = model.replace("anthropic.", "").split("-v")[0];
-			variants.push(base);
-		}
-
-		return variants;
-	}
-
-	/**
-	 * Extract base model name from full model ID.
-	 */
-	private getBaseModelName(model: string): string {
-		// Remove provider prefixes
-		let base = model.replace("us.anthropic.", "").replace("anthropic.", "");
-		// Remove version suffix
-		base = base.split("-v")[0];
-		return base;
-	}
-
 	/**
 	 * Calculate cost for a given token count.
 	 */
@@ -410,6 +627,7 @@ export class PricingCalculator {
 	 */
 	private cleanModelId(model: string): string {
 		// Remove context window suffixes (e.g., [1m] for 1 million, [200k] for 200k)
-		return model.replace(/\[\d+[mk]?\]$/gi, "");
+		// Anchored at the end, so at most one match — no global flag needed
+		return model.replace(/\[\d+[mk]?\]$/i, "");
 	}
 }
@@ -5,8 +5,8 @@
  * Functions for tracking and displaying progress of the autonomous testing agent.
  */
 
-import { existsSync, statSync } from "node:fs";
-import { join } from "node:path";
+import { existsSync, readdirSync, statSync } from "node:fs";
+import { basename, join } from "node:path";
 import type { TestCase, TestCaseStats, TestCasesFile } from "../types/index.ts";
 import {
 	getCompletedCount,
@@ -17,6 +17,18 @@ import {
 // Security constants
 const MAX_JSON_FILE_SIZE = 20 * 1024 * 1024; // 20MB maximum file size limit
 
+// Parsed-file cache keyed by path, invalidated when mtime or size changes.
+// Progress summaries re-read test_cases.json several times per iteration;
+// between writes the parsed result is served from memory instead of
+// re-reading and re-parsing up to 20MB from disk.
+interface CachedTestCases {
+	mtimeMs: number;
+	size: number;
+	testCases: TestCase[];
+}
+
+const testCasesCache = new Map<string, CachedTestCases>();
+
 /**
  * Load test cases from JSON file.
  *
@@ -28,11 +40,12 @@ export async function loadTestCases(
 	testCasesFile: string,
 ): Promise<TestCase[]> {
 	// Security check: validate file size to prevent DoS attacks
+	let fileStats: ReturnType<typeof statSync>;
 	try {
-		const stats = statSync(testCasesFile);
-		if (stats.size > MAX_JSON_FILE_SIZE) {
+		fileStats = statSync(testCasesFile);
+		if (fileStats.size > MAX_JSON_FILE_SIZE) {
 			throw new Error(
-				`JSON file too large: ${stats.size} bytes ` +
+				`JSON file too large: ${fileStats.size} bytes ` +
 					`(max: ${MAX_JSON_FILE_SIZE} bytes / ${MAX_JSON_FILE_SIZE / 1024 / 1024}MB)`,
 			);
 		}
@@ -43,25 +56,45 @@ export async function loadTestCases(
 		throw error;
 	}
 
+	// Serve from cache when the file hasn't changed since the last parse
+	const cached = testCasesCache.get(testCasesFile);
+	if (
+		cached &&
+		cached.mtimeMs === fileStats.mtimeMs &&
+		cached.size === fileStats.size
+	) {
+		return cached.testCases;
+	}
+
+	// Parse straight from the file with Bun's native JSON fast path instead
+	// of materializing an intermediate string and parsing it separately
 	const file = Bun.file(testCasesFile);
-	const content = await file.text();
 
 	let data: unknown;
 	try {
-		data = JSON.parse(content);
+		data = await file.json();
 	} catch (error) {
 		throw new Error(`Failed to parse JSON in ${testCasesFile}: ${error}`);
 	}
 
 	// Handle both dictionary format and list format
+	let testCases: TestCase[];
 	if (Array.isArray(data)) {
-		return data as TestCase[];
+		testCases = data as TestCase[];
 	} else if (data && typeof data === "object") {
-		return (data as TestCasesFile).testCases ?? data.test_cases ?? [];
+		testCases = (data as TestCasesFile).testCases ?? data.test_cases ?? [];
+	} else {
+		console.warn(`test_cases.json has unexpected format: ${typeof data}`);
+		testCases = [];
 	}
 
-	console.warn(`test_cases.json has unexpected format: ${typeof data}`);
-	return [];
+	testCasesCache.set(testCasesFile, {
+		mtimeMs: fileStats.mtimeMs,
+		size: fileStats.size,
+		testCases,
+	});
+
+	return testCases;
 }
 
 /**
@@ -75,27 +108,50 @@ export async function countTestCases(
 ): Promise<TestCaseStats> {
 	const testCasesFile = join(projectDir, "test_cases.json");
 
-	if (!existsSync(testCasesFile)) {
-		return {
-			total: 0,
+	try {
+		// loadTestCases stats the file anyway, so let its ENOENT handling
+		// cover the missing-file case instead of paying a separate existence
+		// check here
+		const testCases = await loadTestCases(testCasesFile);
+
+		// Tally all four statuses in a single pass instead of filtering the
+		// list once per status
+		const stats: TestCaseStats = {
+			total: testCases.length,
 			passed: 0,
 			failed: 0,
 			blocked: 0,
 			notRun: 0,
 		};
-	}
-
-	try {
-		const testCases = await loadTestCases(testCasesFile);
+		for (const tc of testCases) {
+			switch (tc.status) {
+				case "Pass":
+					stats.passed++;
+					break;
+				case "Fail":
+					stats.failed++;
+					break;
+				case "Blocked":
+					stats.blocked++;
+					break;
+				case "Not Run":
+					stats.notRun++;
+					break;
+			}
+		}
 
-		return {
-			total: testCases.length,
-			passed: testCases.filter((tc) => tc.status === "Pass").length,
-			failed: testCases.filter((tc) => tc.status === "Fail").length,
-			blocked: testCases.filter((tc) => tc.status === "Blocked").length,
-			notRun: testCases.filter((tc) => tc.status === "Not Run").length,
-		};
+		return stats;
 	} catch (error) {
+		// A missing file is the normal pre-planning state, not an error
+		if (error instanceof Error && error.message.startsWith("File not found")) {
+			return {
+				total: 0,
+				passed: 0,
+				failed: 0,
+				blocked: 0,
+				notRun: 0,
+			};
+		}
 		console.error(
 			`[CRITICAL] Failed to read test cases from ${testCasesFile}: ${error}`,
 		);
@@ -113,9 +169,50 @@ export async function countTestCases(
 	}
 }
 
+// Defect counts are cached per test-reports tree. Creating or removing a
+// file or subdirectory always bumps its parent directory's mtime, so
+// re-statting every directory seen during the last walk is enough to
+// detect any change without re-walking the whole tree.
+interface CachedDefectCount {
+	dirMtimes: Map<string, number>;
+	count: number;
+}
+
+const defectCountCache = new Map<string, CachedDefectCount>();
+
+/** Raw string check for DEFECT-*.md names, cheaper than a glob or regex */
+function isDefectReportFile(name: string): boolean {
+	return name.startsWith("DEFECT-") && name.endsWith(".md");
+}
+
+/**
+ * Walk a test-reports tree counting DEFECT-*.md files inside
+ * defect-reports directories, recording each directory's mtime on the way.
+ */
+function walkDefectReports(
+	dir: string,
+	dirMtimes: Map<string, number>,
+): number {
+	dirMtimes.set(dir, statSync(dir).mtimeMs);
+
+	const isDefectDir = basename(dir) === "defect-reports";
+	let count = 0;
+	for (const entry of readdirSync(dir, { withFileTypes: true })) {
+		if (entry.isDirectory()) {
+			count += walkDefectReports(join(dir, entry.name), dirMtimes);
+		} else if (isDefectDir && isDefectReportFile(entry.name)) {
+			count++;
+		}
+	}
+	return count;
+}
+
 /**
  * Count total defects reported in test-reports directories.
  *
+ * Results are cached and reused while none of the previously visited
+ * directories have changed.
+ *
  * @param projectDir - Directory containing test-reports
  * @returns Number of defect reports found
  */
@@ -126,15 +223,29 @@ export async function countDefects(projectDir: string): Promise<number> {
 		return 0;
 	}
 
-	// Use glob to find defect reports
-	const glob = new Bun.Glob("**/defect-reports/DEFECT-*.md");
-	const matches = glob.scanSync({ cwd: testReportsDir });
-
-	let count = 0;
-	for (const _ of matches) {
-		count++;
+	const cached = defectCountCache.get(testReportsDir);
+	if (cached) {
+		let fresh = true;
+		for (const [dir, mtimeMs] of cached.dirMtimes) {
+			try {
+				if (statSync(dir).mtimeMs !== mtimeMs) {
+					fresh = false;
+					break;
+				}
+			} catch {
+				fresh = false;
+				break;
+			}
+		}
+		if (fresh) {
+			return cached.count;
+		}
 	}
 
+	const dirMtimes = new Map<string, number>();
+	const count = walkDefectReports(testReportsDir, dirMtimes);
+	defectCountCache.set(testReportsDir, { dirMtimes, count });
+
 	return count;
 }
 
@@ -159,11 +270,14 @@ export function printTestSessionHeader(
  * Print a summary of test execution progress.
  *
  * @param projectDir - Project directory containing test_cases.json
+ * @param precomputedStats - Optional stats from a prior countTestCases call,
+ *   to avoid re-reading and re-parsing test_cases.json
  */
 export async function printTestProgressSummary(
 	projectDir: string,
+	precomputedStats?: TestCaseStats,
 ): Promise<void> {
-	const stats = await countTestCases(projectDir);
+	const stats = precomputedStats ?? (await countTestCases(projectDir));
 
 	if (stats.total === 0) {
 		console.log("\nTest Progress: test_cases.json not yet created");
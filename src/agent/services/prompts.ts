@@ -6,8 +6,14 @@
  * Templates are embedded at compile time for single-binary support.
  */
 
-import { cpSync, existsSync, mkdirSync, writeFileSync } from "node:fs";
-import { dirname, join, resolve } from "node:path";
+import {
+	cpSync,
+	existsSync,
+	mkdirSync,
+	readFileSync,
+	writeFileSync,
+} from "node:fs";
+import { dirname, join, resolve, sep } from "node:path";
 import testExecutorPromptMd from "../prompts/test_executor_prompt.md" with {
 	type: "text",
 };
@@ -74,6 +80,10 @@ export const TEMPLATES_DIR = join(MODULE_DIR, "..", "templates");
 export const UTILS_DIR = join(MODULE_DIR, "..", "utils");
 export const ROOT_DIR = join(MODULE_DIR, "..", "..", ".."); // Project root
 
+// Resolved once at import: prompt paths on the load path are then plain
+// string concatenation instead of a join + resolve per lookup
+const PROMPTS_DIR_PREFIX = resolve(PROMPTS_DIR) + sep;
+
 /**
  * Validate that the project directory is within expected boundaries.
  *
@@ -92,8 +102,11 @@ export function validateProjectDirectory(projectDir: string): string {
 		cwd,
 	];
 
-	const isValid = expectedParents.some((parent) =>
-		resolvedPath.startsWith(parent),
+	// Separator-aware containment: a bare startsWith would accept siblings
+	// like "generations-evil" as being under "generations"
+	const isValid = expectedParents.some(
+		(parent) =>
+			resolvedPath === parent || resolvedPath.startsWith(parent + sep),
 	);
 
 	if (!isValid) {
@@ -106,6 +119,10 @@ export function validateProjectDirectory(projectDir: string): string {
 	return resolvedPath;
 }
 
+// One compiled character-class scan replaces a per-character includes()
+// loop over the name (seven full passes in the worst case)
+const DANGEROUS_CHAR_PATTERN = /[<>:"|?*]/;
+
 /**
  * Validate destination name to prevent path traversal attacks.
  *
@@ -129,20 +146,25 @@ export function validateDestName(destName: string): string {
 		throw new Error(`Null bytes not allowed in destName: ${destName}`);
 	}
 
-	// Check for other dangerous characters
-	const dangerousChars = ["<", ">", ":", '"', "|", "?", "*"];
-	for (const char of dangerousChars) {
-		if (destName.includes(char)) {
-			throw new Error(`Invalid character '${char}' in destName: ${destName}`);
-		}
+	// Check for other dangerous characters in a single pass
+	const dangerousMatch = DANGEROUS_CHAR_PATTERN.exec(destName);
+	if (dangerousMatch) {
+		throw new Error(
+			`Invalid character '${dangerousMatch[0]}' in destName: ${destName}`,
+		);
 	}
 
 	return destName;
 }
 
+// Prompt contents don't change while the agent runs, and the loaders are
+// hit once per session; cache by name so development mode reads each
+// prompt file from disk at most once per process
+const promptCache = new Map<string, string>();
+
 /**
  * Load a prompt template from the prompts directory.
- * Uses embedded prompts in compiled mode.
+ * Uses embedded prompts in compiled mode; results are memoized.
  *
  * @param name - Name of the prompt file (without .md extension)
  * @returns Content of the prompt template
@@ -153,10 +175,17 @@ export async function loadPrompt(name: string): Promise<string> {
 		return EMBEDDED_PROMPTS[name];
 	}
 
+	const cached = promptCache.get(name);
+	if (cached !== undefined) {
+		return cached;
+	}
+
 	// Fall back to file system in development mode
-	const promptPath = join(PROMPTS_DIR, `${name}.md`);
+	const promptPath = `${PROMPTS_DIR_PREFIX}${name}.md`;
 	const file = Bun.file(promptPath);
-	return await file.text();
+	const content = await file.text();
+	promptCache.set(name, content);
+	return content;
 }
 
 /**
@@ -208,10 +237,14 @@ export function copyToProject(
 
 	const destPath = join(validatedDir, validatedDestName);
 
-	// Additional safety check
-	const destPathResolved = resolve(destPath);
-	const validatedDirResolved = resolve(validatedDir);
-	if (!destPathResolved.startsWith(validatedDirResolved)) {
+	// Additional safety check (separator-aware, same as above). validatedDir
+	// is already absolute and resolved, and validatedDestName has been
+	// rejected for "..", absolute prefixes and null bytes, so the normalized
+	// join can be checked lexically without resolving either path again
+	if (
+		destPath !== validatedDir &&
+		!destPath.startsWith(validatedDir + sep)
+	) {
 		throw new Error(`Destination path escapes project directory: ${destName}`);
 	}
 
@@ -234,6 +267,35 @@ export function copyToProject(
 	}
 }
 
+/**
+ * Newest file mtime (ms) under a source directory.
+ *
+ * Used as a cheap staleness fingerprint: any edit to a source file bumps
+ * this value, so matching markers mean the last copy is still current.
+ */
+function latestSourceMtime(sourceDir: string): number {
+	const glob = new Bun.Glob("**/*");
+	let latest = 0;
+	for (const name of glob.scanSync({ cwd: sourceDir })) {
+		const mtime = Bun.file(join(sourceDir, name)).lastModified;
+		if (mtime > latest) {
+			latest = mtime;
+		}
+	}
+	return latest;
+}
+
+/**
+ * Read the mtime marker recorded by the previous copy, or null if absent.
+ */
+function readMtimeMarker(markerFile: string): number | null {
+	if (!existsSync(markerFile)) {
+		return null;
+	}
+	const value = Number(readFileSync(markerFile, "utf-8"));
+	return Number.isFinite(value) ? value : null;
+}
+
 /**
  * Copy the test spec file into the project directory for the agent to read.
  * In compiled mode or when using executor, test_spec.txt is already in the project dir.
@@ -275,13 +337,13 @@ export function copyTemplatesToProject(projectDir: string): void {
 	const validatedDir = validateProjectDirectory(projectDir);
 	const templatesDir = join(validatedDir, "templates");
 
-	if (existsSync(templatesDir)) {
-		console.log("templates already exists in project directory");
-		return;
-	}
-
-	// In compiled mode, write embedded templates
+	// In compiled mode, write embedded templates (embedded content has no
+	// mtime to compare, so presence is the skip criterion)
 	if (IS_COMPILED) {
+		if (existsSync(templatesDir)) {
+			console.log("templates already exists in project directory");
+			return;
+		}
 		mkdirSync(templatesDir, { recursive: true });
 		for (const [filename, content] of Object.entries(EMBEDDED_TEMPLATES)) {
 			const destPath = join(templatesDir, filename);
@@ -291,8 +353,19 @@ export function copyTemplatesToProject(projectDir: string): void {
 		return;
 	}
 
-	// In development mode, copy from source
-	copyToProject(projectDir, TEMPLATES_DIR, "templates", true);
+	// In development mode, copy incrementally: skip when the project copy is
+	// already up to date with the source tree, refresh it when a source
+	// template has changed since the last copy
+	const markerFile = join(validatedDir, ".templates_mtime");
+	const sourceMtime = latestSourceMtime(TEMPLATES_DIR);
+	if (existsSync(templatesDir) && readMtimeMarker(markerFile) === sourceMtime) {
+		console.log("templates already up to date in project directory");
+		return;
+	}
+
+	cpSync(TEMPLATES_DIR, templatesDir, { recursive: true, force: true });
+	writeFileSync(markerFile, String(sourceMtime));
+	console.log("Copied templates to project directory");
 }
 
 /**
@@ -305,13 +378,13 @@ export function copyUtilsToProject(projectDir: string): void {
 	const validatedDir = validateProjectDirectory(projectDir);
 	const utilsDir = join(validatedDir, "utils");
 
-	if (existsSync(utilsDir)) {
-		console.log("utils already exists in project directory");
-		return;
-	}
-
-	// In compiled mode, write embedded utils
+	// In compiled mode, write embedded utils (embedded content has no mtime
+	// to compare, so presence is the skip criterion)
 	if (IS_COMPILED) {
+		if (existsSync(utilsDir)) {
+			console.log("utils already exists in project directory");
+			return;
+		}
 		mkdirSync(utilsDir, { recursive: true });
 		for (const [filename, content] of Object.entries(EMBEDDED_UTILS)) {
 			const destPath = join(utilsDir, filename);
@@ -321,12 +394,22 @@ export function copyUtilsToProject(projectDir: string): void {
 		return;
 	}
 
-	// In development mode, copy from source
+	// In development mode, copy incrementally (see copyTemplatesToProject)
 	if (!existsSync(UTILS_DIR)) {
 		console.log("Utils directory not found, skipping copy");
 		return;
 	}
-	copyToProject(projectDir, UTILS_DIR, "utils", true);
+
+	const markerFile = join(validatedDir, ".utils_mtime");
+	const sourceMtime = latestSourceMtime(UTILS_DIR);
+	if (existsSync(utilsDir) && readMtimeMarker(markerFile) === sourceMtime) {
+		console.log("utils already up to date in project directory");
+		return;
+	}
+
+	cpSync(UTILS_DIR, utilsDir, { recursive: true, force: true });
+	writeFileSync(markerFile, String(sourceMtime));
+	console.log("Copied utils to project directory");
 }
 
 /**
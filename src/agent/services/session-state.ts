@@ -6,7 +6,7 @@
  * Tracks session IDs, timestamps, and progress to determine when to resume vs start fresh.
  */
 
-import { existsSync, readFileSync, writeFileSync } from "node:fs";
+import { existsSync, readFileSync, unlinkSync, writeFileSync } from "node:fs";
 import { join } from "node:path";
 
 /**
@@ -204,8 +204,7 @@ export function clearSessionState(projectDir: string): void {
 
 	if (existsSync(stateFile)) {
 		try {
-			const fs = require("node:fs");
-			fs.unlinkSync(stateFile);
+			unlinkSync(stateFile);
 			console.log("[Session State] Cleared session state");
 		} catch {
 			// Ignore errors
@@ -6,7 +6,14 @@
  * Persists data to usage_statistics.json in the project directory.
  */
 
-import { existsSync, renameSync } from "node:fs";
+import {
+	closeSync,
+	fsyncSync,
+	openSync,
+	readFileSync,
+	renameSync,
+	writeSync,
+} from "node:fs";
 import { join } from "node:path";
 import type {
 	SessionRecord,
@@ -14,7 +21,10 @@ import type {
 	UsageStatistics,
 	UsageSummary,
 } from "../types/index.ts";
-import { PricingCalculator } from "./pricing.ts";
+import {
+	getDefaultPricingCalculator,
+	type PricingCalculator,
+} from "./pricing.ts";
 
 /**
  * Token Usage Tracker class
@@ -27,9 +37,15 @@ export class TokenUsageTracker {
 	private statsFile: string;
 
 	constructor(projectDir: string, pricingCalculator?: PricingCalculator) {
-		this.pricingCalculator = pricingCalculator ?? new PricingCalculator();
+		this.pricingCalculator =
+			pricingCalculator ?? getDefaultPricingCalculator();
 		this.statsFile = join(projectDir, "usage_statistics.json");
 		this.data = this.loadOrInitialize();
+		// Repair summaries that drifted from the session list (e.g. a file
+		// edited by hand or written by an older version)
+		if (this.data.sessions.length !== this.data.summary?.totalSessions) {
+			this.recomputeSummary();
+		}
 	}
 
 	/**
@@ -94,7 +110,7 @@ export class TokenUsageTracker {
 		this.data.sessions.push(sessionRecord);
 
 		// Update summary
-		this.updateSummary();
+		this.updateSummary(sessionRecord);
 
 		// Save to file
 		this.saveToFile();
@@ -123,51 +139,97 @@ export class TokenUsageTracker {
 		const { tokens, costs } = sessionData;
 		const summary = this.getSummary();
 
-		console.log(`\n${"=".repeat(70)}`);
-		console.log("  SESSION STATISTICS");
-		console.log("=".repeat(70));
-		console.log(`\nSession Type: ${sessionData.sessionType}`);
-		console.log(`Duration: ${(sessionData.durationMs / 1000).toFixed(1)}s`);
-		console.log(`Turns: ${sessionData.numTurns}`);
-		console.log(`\nToken Usage:`);
-		console.log(
+		// Collect all lines and emit them with a single console.log (one
+		// underlying write) instead of a syscall per line
+		const lines: string[] = [];
+
+		lines.push(`\n${"=".repeat(70)}`);
+		lines.push("  SESSION STATISTICS");
+		lines.push("=".repeat(70));
+		lines.push(`\nSession Type: ${sessionData.sessionType}`);
+		lines.push(`Duration: ${(sessionData.durationMs / 1000).toFixed(1)}s`);
+		lines.push(`Turns: ${sessionData.numTurns}`);
+		lines.push(`\nToken Usage:`);
+		lines.push(
 			`  Input:         ${tokens.inputTokens.toLocaleString().padStart(10)}  ($${costs.inputCost.toFixed(4)})`,
 		);
-		console.log(
+		lines.push(
 			`  Output:        ${tokens.outputTokens.toLocaleString().padStart(10)}  ($${costs.outputCost.toFixed(4)})`,
 		);
-		console.log(
+		lines.push(
 			`  Cache Write:   ${tokens.cacheCreationTokens.toLocaleString().padStart(10)}  ($${costs.cacheCreationCost.toFixed(4)})`,
 		);
-		console.log(
+		lines.push(
 			`  Cache Read:    ${tokens.cacheReadTokens.toLocaleString().padStart(10)}  ($${costs.cacheReadCost.toFixed(4)})`,
 		);
-		console.log(`  ${"─".repeat(50)}`);
-		console.log(
+		lines.push(`  ${"─".repeat(50)}`);
+		lines.push(
 			`  Total:         ${tokens.totalTokens.toLocaleString().padStart(10)}  ($${costs.totalCost.toFixed(4)})`,
 		);
 
-		console.log(`\nProject Totals:`);
-		console.log(`  Sessions:      ${summary.totalSessions}`);
-		console.log(`  Total Tokens:  ${summary.totalTokens.toLocaleString()}`);
-		console.log(`  Total Cost:    $${summary.totalCostUsd.toFixed(4)}`);
-		console.log(
+		// Cache effectiveness: reads bill at ~0.1x input, so a persistent 0%
+		// read ratio means the cached prefix is silently not being reused
+		const cacheDenominator = tokens.cacheReadTokens + tokens.inputTokens;
+		const cacheHitRatio =
+			cacheDenominator > 0 ? (tokens.cacheReadTokens / cacheDenominator) * 100 : 0;
+		lines.push(
+			`\n[Cache] write=${tokens.cacheCreationTokens.toLocaleString()} read=${tokens.cacheReadTokens.toLocaleString()} ratio=${cacheHitRatio.toFixed(1)}%`,
+		);
+
+		const recentSessions = this.data.sessions.slice(-2);
+		if (
+			recentSessions.length >= 2 &&
+			recentSessions.every((s) => s.tokens.cacheReadTokens === 0)
+		) {
+			lines.push(
+				`[Warning] cache_read=0 for the last ${recentSessions.length} sessions — ` +
+					`cached prefix may be below the model minimum or drifting between iterations`,
+			);
+		}
+
+		lines.push(`\nProject Totals:`);
+		lines.push(`  Sessions:      ${summary.totalSessions}`);
+		lines.push(`  Total Tokens:  ${summary.totalTokens.toLocaleString()}`);
+		lines.push(`  Total Cost:    $${summary.totalCostUsd.toFixed(4)}`);
+		lines.push(
 			`  Avg/Session:   $${(summary.totalCostUsd / summary.totalSessions).toFixed(4)}`,
 		);
-		console.log(`${"=".repeat(70)}\n`);
+		lines.push(`${"=".repeat(70)}\n`);
+
+		console.log(lines.join("\n"));
 	}
 
 	/**
 	 * Persist statistics to usage_statistics.json.
+	 *
+	 * Writes to a temp file, fsyncs it, then renames over the target, so
+	 * concurrent readers (the web server, a second run, the HTML report
+	 * updater) always see either the old or the new complete file and
+	 * need no locking. Set E2E_SAFE_WRITE=1 to also read the temp file
+	 * back and verify it before the rename.
 	 */
 	saveToFile(): void {
 		try {
+			const serialized = JSON.stringify(this.data, null, 2);
 			const tempFile = `${this.statsFile}.tmp`;
-			require("node:fs").writeFileSync(
-				tempFile,
-				JSON.stringify(this.data, null, 2),
-				"utf-8",
-			);
+
+			const fd = openSync(tempFile, "w");
+			try {
+				writeSync(fd, serialized);
+				// Flush to disk before the rename: an unsynced rename could
+				// survive a crash while the new content does not
+				fsyncSync(fd);
+			} finally {
+				closeSync(fd);
+			}
+
+			if (process.env.E2E_SAFE_WRITE === "1") {
+				const readBack = readFileSync(tempFile, "utf-8");
+				if (readBack !== serialized) {
+					throw new Error("temp file verification failed");
+				}
+			}
+
 			renameSync(tempFile, this.statsFile);
 		} catch (error) {
 			console.error(`[Error] Failed to save usage statistics: ${error}`);
@@ -178,14 +240,13 @@ export class TokenUsageTracker {
 	 * Load existing statistics or create new structure.
 	 */
 	private loadOrInitialize(): UsageStatistics {
-		if (existsSync(this.statsFile)) {
-			try {
-				const content = require("node:fs").readFileSync(
-					this.statsFile,
-					"utf-8",
-				);
-				return JSON.parse(content) as UsageStatistics;
-			} catch (error) {
+		// Read directly and treat a missing file as the fresh-start case
+		// instead of stat-ing first — one syscall instead of two
+		try {
+			const content = readFileSync(this.statsFile, "utf-8");
+			return JSON.parse(content) as UsageStatistics;
+		} catch (error) {
+			if ((error as NodeJS.ErrnoException).code !== "ENOENT") {
 				console.warn(`[Warning] Could not load statistics: ${error}`);
 				console.warn(`[Warning] Starting with fresh statistics`);
 			}
@@ -208,28 +269,55 @@ export class TokenUsageTracker {
 	}
 
 	/**
-	 * Update cumulative summary from all sessions.
+	 * Fold a newly recorded session into the cumulative summary.
+	 *
+	 * Adds only the new session's delta to the running counters instead of
+	 * re-summing the whole history, so each record is O(1) regardless of
+	 * how many sessions the project has accumulated.
 	 */
-	private updateSummary(): void {
+	private updateSummary(newSession: SessionRecord): void {
+		const summary = this.data.summary;
+		const { tokens, costs } = newSession;
+
+		summary.totalSessions += 1;
+		summary.totalInputTokens += tokens.inputTokens;
+		summary.totalOutputTokens += tokens.outputTokens;
+		summary.totalCacheCreationTokens += tokens.cacheCreationTokens;
+		summary.totalCacheReadTokens += tokens.cacheReadTokens;
+		// Context window usage = input + cache_read + output
+		// (cache_creation is subset of input, not added to avoid double-counting)
+		summary.totalTokens =
+			summary.totalInputTokens +
+			summary.totalOutputTokens +
+			summary.totalCacheReadTokens;
+		summary.totalCostUsd =
+			Math.round((summary.totalCostUsd + costs.totalCost) * 10000) / 10000;
+		// The session record was stamped microseconds ago; reuse it instead
+		// of formatting a second timestamp
+		summary.lastUpdated = newSession.timestamp;
+	}
+
+	/**
+	 * Rebuild the summary from the full session list.
+	 *
+	 * Fallback for loaded files whose summary is missing or out of step
+	 * with the session list; the per-record path is incremental.
+	 */
+	private recomputeSummary(): void {
 		const sessions = this.data.sessions;
 
-		const totalInput = sessions.reduce(
-			(sum, s) => sum + s.tokens.inputTokens,
-			0,
-		);
-		const totalOutput = sessions.reduce(
-			(sum, s) => sum + s.tokens.outputTokens,
-			0,
-		);
-		const totalCacheCreation = sessions.reduce(
-			(sum, s) => sum + s.tokens.cacheCreationTokens,
-			0,
-		);
-		const totalCacheRead = sessions.reduce(
-			(sum, s) => sum + s.tokens.cacheReadTokens,
-			0,
-		);
-		const totalCost = sessions.reduce((sum, s) => sum + s.costs.totalCost, 0);
+		let totalInput = 0;
+		let totalOutput = 0;
+		let totalCacheCreation = 0;
+		let totalCacheRead = 0;
+		let totalCost = 0;
+		for (const s of sessions) {
+			totalInput += s.tokens.inputTokens;
+			totalOutput += s.tokens.outputTokens;
+			totalCacheCreation += s.tokens.cacheCreationTokens;
+			totalCacheRead += s.tokens.cacheReadTokens;
+			totalCost += s.costs.totalCost;
+		}
 
 		this.data.summary = {
 			totalSessions: sessions.length,
@@ -5,16 +5,15 @@
  * Core session execution logic for running agent queries.
  */
 
-import {
-	type Query,
-	query,
-	type SDKAssistantMessage,
-	type SDKCompactBoundaryMessage,
-	type Options as SDKOptions,
-	type SDKResultMessage,
-	type SDKSystemMessage,
-	type SDKToolProgressMessage,
-	type SDKUserMessage,
+import type {
+	Query,
+	SDKAssistantMessage,
+	SDKCompactBoundaryMessage,
+	Options as SDKOptions,
+	SDKResultMessage,
+	SDKSystemMessage,
+	SDKToolProgressMessage,
+	SDKUserMessage,
 } from "@anthropic-ai/claude-agent-sdk";
 
 // Enable verbose logging for debugging with E2E_DEBUG=1
@@ -31,6 +30,25 @@ import {
 	type UsageData,
 } from "./types/index.ts";
 
+// The SDK runtime is a large module graph; resolve it on first session
+// start instead of at import time so code that only needs the types or
+// neighbouring helpers doesn't pay the load cost. The dynamic import is
+// cached by the runtime after the first call.
+type QueryFn = typeof import("@anthropic-ai/claude-agent-sdk").query;
+let cachedQueryFn: QueryFn | null = null;
+
+async function getQueryFn(): Promise<QueryFn> {
+	if (!cachedQueryFn) {
+		({ query: cachedQueryFn } = await import("@anthropic-ai/claude-agent-sdk"));
+	}
+	return cachedQueryFn;
+}
+
+// The full response is already streamed to stdout as it arrives; callers
+// only ever look at the tail, so retain at most this many characters to
+// avoid holding megabytes of planner output in memory per iteration.
+const RESPONSE_TAIL_LIMIT = 64 * 1024;
+
 /**
  * Run a single agent session using Claude Agent SDK directly.
  *
@@ -48,6 +66,7 @@ export async function runAgentSession(
 
 	// Create the SDK query
 	const startTime = Date.now();
+	const query = await getQueryFn();
 	const q: Query = query({
 		prompt: message,
 		options: {
@@ -60,7 +79,11 @@ export async function runAgentSession(
 	console.log(`[Query sent in ${queryTime.toFixed(1)}s]\n`);
 
 	// Track state
-	let responseText = "";
+	// Buffer streamed text chunks and join once at the end instead of
+	// repeatedly growing one string across the whole session; bounded to the
+	// tail (see RESPONSE_TAIL_LIMIT)
+	const responseParts: string[] = [];
+	let responsePartsLength = 0;
 	const lastEventTime = { value: Date.now() };
 	let toolStartTime: number | null = null;
 	let usageData: UsageData | null = null;
@@ -72,56 +95,12 @@ export async function runAgentSession(
 		for await (const msg of q) {
 			const msgType = msg.type;
 
-			// Handle system messages (init, compact_boundary, status)
-			if (msgType === "system") {
-				const sysMsg = msg as SDKSystemMessage | SDKCompactBoundaryMessage;
-
-				// Debug logging for all system messages
-				if (DEBUG_LOGGING) {
-					const subtypeInfo = "subtype" in sysMsg ? sysMsg.subtype : "unknown";
-					console.log(
-						`\n[DEBUG] System message received: subtype=${subtypeInfo}`,
-					);
-					if (subtypeInfo === "compact_boundary") {
-						console.log(
-							`[DEBUG] compact_metadata: ${JSON.stringify((sysMsg as SDKCompactBoundaryMessage).compact_metadata)}`,
-						);
-					}
-				}
-
-				if ("subtype" in sysMsg) {
-					if (sysMsg.subtype === "init") {
-						sessionId = sysMsg.session_id;
-						console.log(`\n[Session] Session ID: ${sessionId}`);
-					} else if (sysMsg.subtype === "compact_boundary") {
-						handleCompactBoundary(sysMsg as SDKCompactBoundaryMessage);
-					} else if (sysMsg.subtype === "status") {
-						const statusMsg = sysMsg as {
-							status: string | null;
-							uuid?: string;
-							session_id?: string;
-						};
-						if (statusMsg.status === "compacting") {
-							console.log(`\n${"─".repeat(60)}`);
-							console.log(
-								"[Context Compaction] Starting context compaction...",
-							);
-							console.log("─".repeat(60));
-							console.log("  Status: Compacting conversation history");
-							console.log(
-								"  Note: This reduces context size to continue execution",
-							);
-							console.log("─".repeat(60));
-						} else if (statusMsg.status !== null) {
-							// Log other status messages for debugging
-							console.log(`\n[Status] ${statusMsg.status}`);
-						}
-					}
-				}
-			}
+			// Branches are ordered by frequency: assistant/user messages arrive
+			// for every turn and tool call, while system messages are rare
+			// (init, compaction), so the hot types are matched first.
 
 			// Handle assistant messages (text and tool use)
-			else if (msgType === "assistant") {
+			if (msgType === "assistant") {
 				const assistantMsg = msg as SDKAssistantMessage;
 
 				// Check for API errors (authentication_failed, billing_error, rate_limit, etc.)
@@ -164,7 +143,18 @@ export async function runAgentSession(
 				}
 
 				const result = handleAssistantMessage(assistantMsg, lastEventTime);
-				responseText += result.text;
+				if (result.text) {
+					responseParts.push(result.text);
+					responsePartsLength += result.text.length;
+					// Drop oldest chunks once the buffer exceeds the tail limit
+					while (
+						responsePartsLength > RESPONSE_TAIL_LIMIT &&
+						responseParts.length > 1
+					) {
+						const dropped = responseParts.shift() as string;
+						responsePartsLength -= dropped.length;
+					}
+				}
 				if (result.toolStartTime !== null) {
 					toolStartTime = result.toolStartTime;
 				}
@@ -177,6 +167,54 @@ export async function runAgentSession(
 				toolStartTime = null;
 			}
 
+			// Handle system messages (init, compact_boundary, status)
+			else if (msgType === "system") {
+				const sysMsg = msg as SDKSystemMessage | SDKCompactBoundaryMessage;
+
+				// Debug logging for all system messages
+				if (DEBUG_LOGGING) {
+					const subtypeInfo = "subtype" in sysMsg ? sysMsg.subtype : "unknown";
+					console.log(
+						`\n[DEBUG] System message received: subtype=${subtypeInfo}`,
+					);
+					if (subtypeInfo === "compact_boundary") {
+						console.log(
+							`[DEBUG] compact_metadata: ${JSON.stringify((sysMsg as SDKCompactBoundaryMessage).compact_metadata)}`,
+						);
+					}
+				}
+
+				if ("subtype" in sysMsg) {
+					if (sysMsg.subtype === "init") {
+						sessionId = sysMsg.session_id;
+						console.log(`\n[Session] Session ID: ${sessionId}`);
+					} else if (sysMsg.subtype === "compact_boundary") {
+						handleCompactBoundary(sysMsg as SDKCompactBoundaryMessage);
+					} else if (sysMsg.subtype === "status") {
+						const statusMsg = sysMsg as {
+							status: string | null;
+							uuid?: string;
+							session_id?: string;
+						};
+						if (statusMsg.status === "compacting") {
+							console.log(`\n${"─".repeat(60)}`);
+							console.log(
+								"[Context Compaction] Starting context compaction...",
+							);
+							console.log("─".repeat(60));
+							console.log("  Status: Compacting conversation history");
+							console.log(
+								"  Note: This reduces context size to continue execution",
+							);
+							console.log("─".repeat(60));
+						} else if (statusMsg.status !== null) {
+							// Log other status messages for debugging
+							console.log(`\n[Status] ${statusMsg.status}`);
+						}
+					}
+				}
+			}
+
 			// Handle result message (final message with usage stats)
 			else if (msgType === "result") {
 				const resultMsg = msg as SDKResultMessage;
@@ -313,7 +351,7 @@ export async function runAgentSession(
 	return {
 		result: {
 			status: SessionStatus.CONTINUE,
-			responseText,
+			responseText: responseParts.join(""),
 			usageData,
 		},
 		sessionId,
@@ -6,7 +6,7 @@
  * Skills are modular capabilities that extend Claude's functionality.
  */
 
-import { existsSync } from "node:fs";
+import { existsSync, readdirSync, statSync } from "node:fs";
 import { dirname, join, resolve } from "node:path";
 
 // Get the directory where this module is located
@@ -60,6 +60,46 @@ export function findSkillPluginPath(
 	return null;
 }
 
+/**
+ * Probe result for a plugin directory
+ */
+type PluginProbe = "missing" | "invalid" | "valid";
+
+// Plugin directories are static for the life of the process, so probe each
+// path at most once: a single readdir replaces the existence check plus two
+// subpath probes per validation
+const pluginProbeCache = new Map<string, PluginProbe>();
+
+/**
+ * Probe a plugin directory once and classify it.
+ */
+function probePluginDirectory(pluginPath: string): PluginProbe {
+	const cached = pluginProbeCache.get(pluginPath);
+	if (cached !== undefined) {
+		return cached;
+	}
+
+	let result: PluginProbe;
+	try {
+		const entries = readdirSync(pluginPath);
+		if (entries.includes("skills")) {
+			result = "valid";
+		} else if (
+			entries.includes(".claude-plugin") &&
+			existsSync(join(pluginPath, ".claude-plugin", "plugin.json"))
+		) {
+			result = "valid";
+		} else {
+			result = "invalid";
+		}
+	} catch {
+		result = "missing";
+	}
+
+	pluginProbeCache.set(pluginPath, result);
+	return result;
+}
+
 /**
  * Validate that a directory has a valid plugin structure.
  *
@@ -71,14 +111,7 @@ export function findSkillPluginPath(
  * @returns True if valid plugin structure, False otherwise
  */
 export function validatePluginDirectory(pluginPath: string): boolean {
-	if (!existsSync(pluginPath)) {
-		return false;
-	}
-
-	const pluginJson = join(pluginPath, ".claude-plugin", "plugin.json");
-	const skillDir = join(pluginPath, "skills");
-
-	return existsSync(pluginJson) || existsSync(skillDir);
+	return probePluginDirectory(pluginPath) === "valid";
 }
 
 /**
@@ -105,10 +138,18 @@ export function collectPluginDirectories(
 
 	// Load default skills if enabled (skip in compiled mode - plugins not available)
 	if (loadDefaultSkills && !IS_COMPILED) {
+		// One readdir of the plugins directory replaces a stat per default
+		// skill; membership in the listing stands in for existsSync
+		let pluginEntries: Set<string>;
+		try {
+			pluginEntries = new Set(readdirSync(DEFAULT_PLUGINS_DIR));
+		} catch {
+			pluginEntries = new Set();
+		}
+
 		for (const skillName of DEFAULT_SKILLS) {
-			const skillPluginPath = join(DEFAULT_PLUGINS_DIR, skillName);
-			if (existsSync(skillPluginPath)) {
-				allPluginDirs.push(skillPluginPath);
+			if (pluginEntries.has(skillName)) {
+				allPluginDirs.push(join(DEFAULT_PLUGINS_DIR, skillName));
 			} else if (verbose) {
 				console.log(
 					`Warning: Default skill '${skillName}' not found in ${DEFAULT_PLUGINS_DIR}`,
@@ -120,19 +161,21 @@ export function collectPluginDirectories(
 	// Add user-specified plugin directories
 	allPluginDirs.push(...pluginDirs);
 
-	// Validate and deduplicate
+	// Validate and deduplicate (one probe per path covers both the
+	// existence check and the structure validation)
 	const validatedPluginDirs: string[] = [];
 	for (const pluginDir of allPluginDirs) {
 		const pluginPath = resolve(pluginDir);
+		const probe = probePluginDirectory(pluginPath);
 
-		if (!existsSync(pluginPath)) {
+		if (probe === "missing") {
 			if (verbose) {
 				console.log(`Warning: Plugin directory does not exist: ${pluginPath}`);
 			}
 			continue;
 		}
 
-		if (validatePluginDirectory(pluginPath)) {
+		if (probe === "valid") {
 			// Avoid duplicates
 			if (!validatedPluginDirs.includes(pluginPath)) {
 				validatedPluginDirs.push(pluginPath);
@@ -165,25 +208,22 @@ export async function loadSkillContent(
 ): Promise<string | null> {
 	const searchDir = pluginsDir ?? DEFAULT_PLUGINS_DIR;
 
-	// Try standard plugin structure: plugins/<skill>/skills/<skill>/SKILL.md
-	const skillMdPath = join(
-		searchDir,
-		skillName,
-		"skills",
-		skillName,
-		"SKILL.md",
-	);
-
-	if (existsSync(skillMdPath)) {
-		const file = Bun.file(skillMdPath);
-		return await file.text();
-	}
+	// Open each candidate directly and treat a failed read as "not there"
+	// instead of stat-ing first: one syscall in the hit case rather than a
+	// stat plus an open per candidate
+	const candidates = [
+		// Standard plugin structure: plugins/<skill>/skills/<skill>/SKILL.md
+		join(searchDir, skillName, "skills", skillName, "SKILL.md"),
+		// Alternative structure: plugins/<skill>/SKILL.md
+		join(searchDir, skillName, "SKILL.md"),
+	];
 
-	// Try alternative structure: plugins/<skill>/SKILL.md
-	const altPath = join(searchDir, skillName, "SKILL.md");
-	if (existsSync(altPath)) {
-		const file = Bun.file(altPath);
-		return await file.text();
+	for (const candidate of candidates) {
+		try {
+			return await Bun.file(candidate).text();
+		} catch {
+			// Missing candidate: fall through to the next one
+		}
 	}
 
 	return null;
@@ -202,7 +242,6 @@ export function findAvailableSkills(pluginsDir?: string): string[] {
 		return [];
 	}
 
-	const { readdirSync, statSync } = require("node:fs");
 	const entries = readdirSync(searchDir);
 	const skills: string[] = [];
 
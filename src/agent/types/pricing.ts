@@ -79,6 +79,9 @@ export interface UsageStatistics {
 export interface PricingCache {
 	fetchedAt: number;
 	sourceUrl: string;
+	/** HTTP validators from the last full fetch, used for conditional GETs */
+	etag?: string;
+	lastModified?: string;
 	pricing: Record<string, LiteLLMModelPricing>;
 }
 
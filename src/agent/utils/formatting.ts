@@ -5,6 +5,10 @@
  * Functions for formatting tool use and result output.
  */
 
+// Compiled once; a case-insensitive regex search avoids lowercasing the
+// entire (possibly huge) tool output just to find a 7-char needle
+const BLOCKED_PATTERN = /blocked/i;
+
 /**
  * Format size in human-readable format
  */
@@ -23,20 +27,22 @@ export function formatToolUseOutput(
 	toolInput?: unknown,
 	maxInputLen: number = 200,
 ): void {
-	console.log(
-		`\n[Tool: ${toolName}] (after ${thinkingTime.toFixed(1)}s thinking)`,
-	);
+	// Coalesce the whole event into one console.log (one underlying write)
+	// instead of issuing a syscall per line
+	let message = `\n[Tool: ${toolName}] (after ${thinkingTime.toFixed(1)}s thinking)`;
 
 	if (toolInput !== undefined) {
 		const inputStr = JSON.stringify(toolInput);
 		const inputSize = Buffer.byteLength(inputStr, "utf8");
-		console.log(`   Input size: ${formatSize(inputSize)}`);
+		message += `\n   Input size: ${formatSize(inputSize)}`;
 		if (inputStr.length > maxInputLen) {
-			console.log(`   Input: ${inputStr.slice(0, maxInputLen)}...`);
+			message += `\n   Input: ${inputStr.slice(0, maxInputLen)}...`;
 		} else {
-			console.log(`   Input: ${inputStr}`);
+			message += `\n   Input: ${inputStr}`;
 		}
 	}
+
+	console.log(message);
 }
 
 /**
@@ -51,23 +57,24 @@ export function formatToolResultOutput(
 	const timeSuffix =
 		executionTime !== undefined ? ` (took ${executionTime.toFixed(1)}s)` : "";
 	const outputSize = Buffer.byteLength(resultContent, "utf8");
-	console.log(`   Output size: ${formatSize(outputSize)}`);
 
-	if (resultContent.toLowerCase().includes("blocked")) {
-		const truncated =
-			resultContent.length > maxLen
-				? `${resultContent.slice(0, maxLen)}...`
-				: resultContent;
-		console.log(`   [BLOCKED]${timeSuffix} ${truncated}`);
+	// Truncate once up front; both the blocked and error branches need it
+	const truncated =
+		resultContent.length > maxLen
+			? `${resultContent.slice(0, maxLen)}...`
+			: resultContent;
+
+	// Coalesce the whole event into one console.log (one underlying write)
+	let statusLine: string;
+	if (BLOCKED_PATTERN.test(resultContent)) {
+		statusLine = `   [BLOCKED]${timeSuffix} ${truncated}`;
 	} else if (isError) {
-		const truncated =
-			resultContent.length > maxLen
-				? `${resultContent.slice(0, maxLen)}...`
-				: resultContent;
-		console.log(`   [Error]${timeSuffix} ${truncated}`);
+		statusLine = `   [Error]${timeSuffix} ${truncated}`;
 	} else {
-		console.log(`   [Done]${timeSuffix}`);
+		statusLine = `   [Done]${timeSuffix}`;
 	}
+
+	console.log(`   Output size: ${formatSize(outputSize)}\n${statusLine}`);
 }
 
 /**
@@ -6,23 +6,54 @@ Provides safe, robust utilities for reading, counting, and updating test_cases.j
 without the fragility of grep/sed text processing.
 """
 
+import functools
 import json
+import mmap
 import os
 import re
 import sys
 import shutil
+from collections import Counter
+from operator import methodcaller
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
+# Optional C-accelerated JSON codec; several times faster than stdlib json
+# for both parse and serialize when available
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Security constants
 MAX_JSON_FILE_SIZE = 20 * 1024 * 1024  # 20MB maximum file size limit
 ALLOWED_JSON_FILENAMES = {'test_cases.json', 'test_env.json', 'usage_statistics.json'}
 
+# Above this size, parse straight from an mmap view instead of copying the
+# whole file into a bytes object first (only worthwhile for large suites)
+_MMAP_READ_THRESHOLD = 1024 * 1024
+
+# Prebound accessor equivalent to tc.get('status', 'Not Run'); usable with
+# map() so tally loops run entirely in C
+_GET_STATUS = methodcaller('get', 'status', 'Not Run')
+
+
+# Working directory resolved once at import. These helpers run as
+# short-lived CLI scripts inside the project directory and never chdir,
+# so the cwd is a process-lifetime constant and does not need re-statting
+# on every validation.
+_CWD = Path.cwd().resolve()
+
 
+@functools.lru_cache(maxsize=64)
 def validate_json_path(json_path: str, allow_write: bool = False) -> Path:
     """
     Validate and sanitize JSON file path to prevent path traversal attacks.
 
+    Successful validations are memoized per input, so repeated helper
+    calls on the same path skip the resolve() syscalls. Failures are not
+    cached and re-raise on every call.
+
     Args:
         json_path: File path to validate
         allow_write: Whether write operations are allowed
@@ -43,12 +74,9 @@ def validate_json_path(json_path: str, allow_write: bool = False) -> Path:
     # Get absolute path
     abs_path = path.resolve()
 
-    # Get current working directory
-    cwd = Path.cwd().resolve()
-
     # Ensure path is within current working directory or its subdirectories
     try:
-        abs_path.relative_to(cwd)
+        abs_path.relative_to(_CWD)
     except ValueError:
         raise ValueError(f"Path must be within current working directory: {json_path}")
 
@@ -62,28 +90,76 @@ def validate_json_path(json_path: str, allow_write: bool = False) -> Path:
     return abs_path
 
 
-def check_file_size(file_path: Path) -> None:
-    """
-    Check if file size is within allowed limits.
+# Parsed-file cache keyed by validated absolute path. Entries are
+# (st_mtime_ns, st_size, data, id_index, status_index) and are served only
+# while both stat fields still match, so commands that re-read the same
+# file (count, then list, then stats) parse it once instead of once per
+# query. id_index maps case_id to list position for O(1) lookups;
+# status_index maps raw status values to the positions carrying them.
+_READ_CACHE: Dict[Path, Any] = {}
 
-    Args:
-        file_path: File path
 
-    Raises:
-        ValueError: If file is too large
-    """
-    if file_path.exists():
-        file_size = file_path.stat().st_size
-        if file_size > MAX_JSON_FILE_SIZE:
-            raise ValueError(
-                f"File too large: {file_size} bytes (max: {MAX_JSON_FILE_SIZE} bytes)"
-            )
+def _load_test_cases(json_path: str) -> tuple:
+    """Load test cases plus their lookup indexes, parsing at most once."""
+    # Validate path security
+    validated_path = validate_json_path(json_path)
+
+    # One stat covers the size limit check and the cache key
+    stat_result = validated_path.stat()
+    if stat_result.st_size > MAX_JSON_FILE_SIZE:
+        raise ValueError(
+            f"File too large: {stat_result.st_size} bytes (max: {MAX_JSON_FILE_SIZE} bytes)"
+        )
+
+    cached = _READ_CACHE.get(validated_path)
+    if (
+        cached is not None
+        and cached[0] == stat_result.st_mtime_ns
+        and cached[1] == stat_result.st_size
+    ):
+        return cached[2], cached[3], cached[4]
+
+    if orjson is not None and stat_result.st_size > _MMAP_READ_THRESHOLD:
+        # orjson accepts any buffer, so large files can be parsed directly
+        # from the page cache without materializing a bytes copy first
+        with open(validated_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                data = orjson.loads(memoryview(mm))
+    else:
+        raw = validated_path.read_bytes()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+    # Validate return data type
+    if not isinstance(data, list):
+        raise ValueError(f"Expected list of test cases, got {type(data).__name__}")
+
+    id_index: Dict[Any, int] = {}
+    status_index: Dict[Any, List[int]] = {}
+    # Hoist the attribute lookup out of the loop body
+    setdefault = status_index.setdefault
+    for i, tc in enumerate(data):
+        if not isinstance(tc, dict):
+            continue
+        id_index[tc.get('case_id')] = i
+        setdefault(tc.get('status'), []).append(i)
+
+    _READ_CACHE[validated_path] = (
+        stat_result.st_mtime_ns,
+        stat_result.st_size,
+        data,
+        id_index,
+        status_index,
+    )
+    return data, id_index, status_index
 
 
 def read_test_cases(json_path: str = "test_cases.json") -> List[Dict[str, Any]]:
     """
     Safely read test_cases.json file.
 
+    Results are cached per file and revalidated by mtime and size, so
+    repeated reads of an unchanged file skip the JSON parse.
+
     Args:
         json_path: Path to test_cases.json (default: ./test_cases.json)
 
@@ -95,20 +171,7 @@ def read_test_cases(json_path: str = "test_cases.json") -> List[Dict[str, Any]]:
         json.JSONDecodeError: If file is not valid JSON
         ValueError: If path validation fails or file is too large
     """
-    # Validate path security
-    validated_path = validate_json_path(json_path)
-
-    # Check file size
-    check_file_size(validated_path)
-
-    with open(validated_path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-
-    # Validate return data type
-    if not isinstance(data, list):
-        raise ValueError(f"Expected list of test cases, got {type(data).__name__}")
-
-    return data
+    return _load_test_cases(json_path)[0]
 
 
 def write_test_cases(test_cases: List[Dict[str, Any]], json_path: str = "test_cases.json") -> None:
@@ -130,14 +193,34 @@ def write_test_cases(test_cases: List[Dict[str, Any]], json_path: str = "test_ca
     # Validate path security
     validated_path = validate_json_path(json_path, allow_write=True)
 
-    # Create backup before writing
+    # Create backup before writing: a hardlink shares the inode instead of
+    # re-copying the whole file; fall back to a byte copy where links are
+    # unsupported (e.g. some network filesystems)
     backup_path = validated_path.with_suffix('.json.bak')
     if validated_path.exists():
-        shutil.copy2(validated_path, backup_path)
-
-    # Write with pretty formatting
-    with open(validated_path, 'w', encoding='utf-8') as f:
-        json.dump(test_cases, f, indent=2, ensure_ascii=False)
+        try:
+            if backup_path.exists():
+                backup_path.unlink()
+            os.link(validated_path, backup_path)
+        except OSError:
+            shutil.copy2(validated_path, backup_path)
+
+    # Drop any cached parse; the next read revalidates against the new file
+    _READ_CACHE.pop(validated_path, None)
+
+    # Serialize fully in memory and write in one shot; json.dump against a
+    # file object issues one small write per token. orjson emits UTF-8
+    # directly, matching ensure_ascii=False.
+    if orjson is not None:
+        payload = orjson.dumps(test_cases, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(test_cases, indent=2, ensure_ascii=False).encode('utf-8')
+
+    # Write to a temp file and rename over the target so readers never
+    # observe a partially written file
+    tmp_path = validated_path.with_suffix('.json.tmp')
+    tmp_path.write_bytes(payload)
+    os.replace(tmp_path, validated_path)
 
 
 def count_by_status(status: str, json_path: str = "test_cases.json") -> int:
@@ -151,8 +234,8 @@ def count_by_status(status: str, json_path: str = "test_cases.json") -> int:
     Returns:
         Count of test cases with specified status
     """
-    test_cases = read_test_cases(json_path)
-    return sum(1 for tc in test_cases if tc.get('status') == status)
+    _, _, status_index = _load_test_cases(json_path)
+    return len(status_index.get(status, ()))
 
 
 def get_test_case_by_id(case_id: str, json_path: str = "test_cases.json") -> Optional[Dict[str, Any]]:
@@ -166,11 +249,9 @@ def get_test_case_by_id(case_id: str, json_path: str = "test_cases.json") -> Opt
     Returns:
         Test case dictionary or None if not found
     """
-    test_cases = read_test_cases(json_path)
-    for tc in test_cases:
-        if tc.get('case_id') == case_id:
-            return tc
-    return None
+    test_cases, id_index, _ = _load_test_cases(json_path)
+    index = id_index.get(case_id)
+    return test_cases[index] if index is not None else None
 
 
 def update_test_case(
@@ -197,20 +278,39 @@ def update_test_case(
     Returns:
         True if update succeeded, False if case_id not found
     """
-    test_cases = read_test_cases(json_path)
+    test_cases, id_index, _ = _load_test_cases(json_path)
 
-    # Find the test case
-    test_case = None
-    for tc in test_cases:
-        if tc.get('case_id') == case_id:
-            test_case = tc
-            break
+    # Find the test case via the index
+    index = id_index.get(case_id)
+    test_case = test_cases[index] if index is not None else None
 
     if not test_case:
         print(f"Error: Test case {case_id} not found", file=sys.stderr)
         return False
 
-    # Update fields (only update if provided)
+    _apply_fields(
+        test_case,
+        status=status,
+        actual_result=actual_result,
+        defect_ids=defect_ids,
+        screenshots=screenshots,
+        logs=logs,
+    )
+
+    # Write back to file
+    write_test_cases(test_cases, json_path)
+    return True
+
+
+def _apply_fields(
+    test_case: Dict[str, Any],
+    status: Optional[str] = None,
+    actual_result: Optional[str] = None,
+    defect_ids: Optional[List[str]] = None,
+    screenshots: Optional[List[str]] = None,
+    logs: Optional[List[str]] = None
+) -> None:
+    """Apply provided fields to a test case in place (None means keep)."""
     if status is not None:
         test_case['status'] = status
 
@@ -230,9 +330,50 @@ def update_test_case(
     if logs is not None:
         test_case['evidence']['logs'] = logs
 
-    # Write back to file
-    write_test_cases(test_cases, json_path)
-    return True
+
+def update_test_cases_bulk(
+    updates: List[Dict[str, Any]],
+    json_path: str = "test_cases.json"
+) -> int:
+    """
+    Apply many test case updates with one read and one write.
+
+    Each update dictionary must carry a 'case_id' and may carry the same
+    optional fields as update_test_case. Updating K cases one by one costs
+    K parses, K backups and K rewrites; this applies them all against a
+    single load and writes once.
+
+    Args:
+        updates: List of update dictionaries
+        json_path: Path to test_cases.json
+
+    Returns:
+        Number of test cases updated (unknown case_ids are reported to
+        stderr and skipped)
+    """
+    test_cases, id_index, _ = _load_test_cases(json_path)
+
+    updated = 0
+    for update in updates:
+        case_id = update.get('case_id')
+        index = id_index.get(case_id)
+        if index is None:
+            print(f"Error: Test case {case_id} not found", file=sys.stderr)
+            continue
+
+        _apply_fields(
+            test_cases[index],
+            status=update.get('status'),
+            actual_result=update.get('actual_result'),
+            defect_ids=update.get('defect_ids'),
+            screenshots=update.get('screenshots'),
+            logs=update.get('logs'),
+        )
+        updated += 1
+
+    if updated:
+        write_test_cases(test_cases, json_path)
+    return updated
 
 
 def get_test_statistics(json_path: str = "test_cases.json") -> Dict[str, int]:
@@ -247,21 +388,18 @@ def get_test_statistics(json_path: str = "test_cases.json") -> Dict[str, int]:
     """
     test_cases = read_test_cases(json_path)
 
-    stats = {
+    # Counter + map + methodcaller keeps the whole tally loop in C with no
+    # per-case bytecode at all
+    counts = Counter(map(_GET_STATUS, test_cases))
+
+    return {
         "total": len(test_cases),
-        "Not Run": 0,
-        "Pass": 0,
-        "Fail": 0,
-        "Blocked": 0
+        "Not Run": counts["Not Run"],
+        "Pass": counts["Pass"],
+        "Fail": counts["Fail"],
+        "Blocked": counts["Blocked"],
     }
 
-    for tc in test_cases:
-        status = tc.get('status', 'Not Run')
-        if status in stats:
-            stats[status] += 1
-
-    return stats
-
 
 def list_tests_by_status(status: str, json_path: str = "test_cases.json") -> List[str]:
     """
@@ -274,15 +412,18 @@ def list_tests_by_status(status: str, json_path: str = "test_cases.json") -> Lis
     Returns:
         List of case_ids with specified status
     """
-    test_cases = read_test_cases(json_path)
-    return [tc['case_id'] for tc in test_cases if tc.get('status') == status]
+    test_cases, _, status_index = _load_test_cases(json_path)
+    return [test_cases[i]['case_id'] for i in status_index.get(status, ())]
 
 
 # CLI input validation constants and functions
 VALID_STATUSES = {'Not Run', 'Pass', 'Fail', 'Blocked'}
 CASE_ID_PATTERN = re.compile(r'^TC-\d{1,4}$')
+# One compiled scan replaces a per-character Python loop over the blacklist
+DANGEROUS_ITEM_PATTERN = re.compile(r'\.\.|[/\\\x00\n\r]')
 
 
+@functools.lru_cache(maxsize=256)
 def validate_status(status: str) -> str:
     """Validate if status value is valid."""
     if status not in VALID_STATUSES:
@@ -290,6 +431,7 @@ def validate_status(status: str) -> str:
     return status
 
 
+@functools.lru_cache(maxsize=4096)
 def validate_case_id(case_id: str) -> str:
     """Validate test case ID format."""
     if not CASE_ID_PATTERN.match(case_id):
@@ -297,16 +439,22 @@ def validate_case_id(case_id: str) -> str:
     return case_id
 
 
-def validate_list_input(value: str) -> List[str]:
-    """Validate and parse comma-separated list input."""
-    items = [item.strip() for item in value.split(',') if item.strip()]
-    # Check for dangerous characters
+def validate_list_items(items: List[str]) -> List[str]:
+    """Validate already-split list items against the item blacklist."""
     for item in items:
-        if any(char in item for char in ['..', '/', '\\', '\x00', '\n', '\r']):
+        if not isinstance(item, str):
+            raise ValueError(f"List items must be strings, got: {type(item).__name__}")
+        # Check for dangerous characters in a single compiled scan per item
+        if DANGEROUS_ITEM_PATTERN.search(item):
             raise ValueError(f"Invalid characters in list item: {item}")
     return items
 
 
+def validate_list_input(value: str) -> List[str]:
+    """Validate and parse comma-separated list input."""
+    return validate_list_items([item.strip() for item in value.split(',') if item.strip()])
+
+
 # CLI interface
 if __name__ == "__main__":
     if len(sys.argv) < 2:
@@ -316,6 +464,7 @@ if __name__ == "__main__":
         print("  python json_helper.py list <status>")
         print("  python json_helper.py get <case_id>")
         print("  python json_helper.py update <case_id> --status <status> --actual-result <result> ...")
+        print("  python json_helper.py batch < updates.json   (JSON list of update objects)")
         sys.exit(1)
 
     command = sys.argv[1]
@@ -343,8 +492,9 @@ if __name__ == "__main__":
                 sys.exit(1)
             status = validate_status(sys.argv[2])
             case_ids = list_tests_by_status(status)
-            for case_id in case_ids:
-                print(case_id)
+            # One write for the whole listing instead of a print per ID
+            if case_ids:
+                sys.stdout.write("\n".join(case_ids) + "\n")
 
         elif command == "get":
             if len(sys.argv) < 3:
@@ -394,6 +544,37 @@ if __name__ == "__main__":
             else:
                 sys.exit(1)
 
+        elif command == "batch":
+            # Updates come via stdin so the file path allowlist stays intact
+            updates = json.loads(sys.stdin.read())
+            if not isinstance(updates, list):
+                print("Error: batch input must be a JSON list", file=sys.stderr)
+                sys.exit(1)
+
+            for update in updates:
+                validate_case_id(str(update.get('case_id', '')))
+                if update.get('status') is not None:
+                    validate_status(update['status'])
+                # List fields arrive either as JSON lists or comma-separated
+                # strings; both forms go through the same item validation
+                for key in ('defect_ids', 'screenshots', 'logs'):
+                    value = update.get(key)
+                    if value is None:
+                        continue
+                    if isinstance(value, str):
+                        update[key] = validate_list_input(value)
+                    elif isinstance(value, list):
+                        update[key] = validate_list_items(value)
+                    else:
+                        raise ValueError(
+                            f"{key} must be a list or comma-separated string"
+                        )
+
+            updated = update_test_cases_bulk(updates)
+            print(f"Successfully updated {updated} of {len(updates)} test cases")
+            if updated < len(updates):
+                sys.exit(1)
+
         else:
             print(f"Unknown command: {command}", file=sys.stderr)
             sys.exit(1)
@@ -29,6 +29,33 @@ interface TestCaseSummary {
 	priority: string;
 }
 
+// Dangerous content patterns for test spec validation, compiled once at
+// module load. No global flags: each pattern is only probed with test()
+// for a single match, and a shared global regex would carry lastIndex
+// state between calls. The case-insensitive flags are load-bearing
+// (e.g. "EVAL(" must still be caught) and are kept.
+const DANGEROUS_SPEC_PATTERNS = [
+	// Template and code injection
+	{ pattern: /`[^`]*\$\{/, name: "template injection" },
+	{ pattern: /\beval\s*\(/i, name: "eval() call" },
+	{ pattern: /\bexec\s*\(/i, name: "exec() call" },
+	// XSS patterns
+	{ pattern: /<script[\s>]/i, name: "script tag" },
+	{ pattern: /javascript:/i, name: "javascript: protocol" },
+	{ pattern: /on\w+\s*=/i, name: "event handler" },
+	// Shell command substitution
+	{ pattern: /\$\([^)]*\)/, name: "shell command substitution" },
+	{ pattern: /`[^`]+`/, name: "backtick command execution" },
+	// Path traversal - check for sequences that could escape directories
+	{ pattern: /\.\.[\\/](?:\.\.[\\/])*/, name: "path traversal" },
+	// Null byte injection
+	{ pattern: /\x00/, name: "null byte injection" },
+];
+
+// Shell metacharacters in suspicious contexts: allow these characters in
+// normal text but flag concentrated use
+const SHELL_METACHAR_PATTERN = /[;&|]{2,}|[><]{2}|[|]{2}/;
+
 // ====================================
 // JobService Class
 // ====================================
@@ -116,34 +143,13 @@ export class JobService {
 	 */
 	private validateTestSpecContent(content: string): string | null {
 		// Check for dangerous patterns that could be used for code injection
-		const dangerousPatterns = [
-			// Template and code injection
-			{ pattern: /`[^`]*\$\{/g, name: "template injection" },
-			{ pattern: /\beval\s*\(/gi, name: "eval() call" },
-			{ pattern: /\bexec\s*\(/gi, name: "exec() call" },
-			// XSS patterns
-			{ pattern: /<script[\s>]/gi, name: "script tag" },
-			{ pattern: /javascript:/gi, name: "javascript: protocol" },
-			{ pattern: /on\w+\s*=/gi, name: "event handler" },
-			// Shell command substitution
-			{ pattern: /\$\([^)]*\)/g, name: "shell command substitution" },
-			{ pattern: /`[^`]+`/g, name: "backtick command execution" },
-			// Path traversal - check for sequences that could escape directories
-			{ pattern: /\.\.[\\/](?:\.\.[\\/])*/g, name: "path traversal" },
-			// Null byte injection
-			{ pattern: /\x00/g, name: "null byte injection" },
-		];
-
-		for (const { pattern, name } of dangerousPatterns) {
+		for (const { pattern, name } of DANGEROUS_SPEC_PATTERNS) {
 			if (pattern.test(content)) {
 				return `Test specification contains potentially dangerous content: ${name}`;
 			}
 		}
 
-		// Check for shell metacharacters in suspicious contexts
-		// Allow these characters in normal text but flag concentrated use
-		const shellMetacharPattern = /[;&|]{2,}|[><]{2}|[|]{2}/g;
-		if (shellMetacharPattern.test(content)) {
+		if (SHELL_METACHAR_PATTERN.test(content)) {
 			return `Test specification contains potentially dangerous content: shell operator sequences`;
 		}
 
@@ -715,27 +721,33 @@ export function formatDateTime(isoStr: string | null): string {
 	}
 }
 
+// Table header and separator are constant; pad them once at module load
+// instead of re-padding on every listing
+const JOB_LIST_HEADER = `${"JOB ID".padEnd(36)}  ${"STATUS".padEnd(12)}  ${"CREATED".padEnd(20)}`;
+const JOB_LIST_SEPARATOR = `${"------".padEnd(36)}  ${"------".padEnd(12)}  ${"-------".padEnd(20)}`;
+
 export function printJobList(jobs: Job[], limit: number): void {
 	if (jobs.length === 0) {
 		console.log("No jobs found.");
 		return;
 	}
 
-	console.log(`\nJobs (showing up to ${limit}, total: ${jobs.length}):`);
-	console.log("=".repeat(80));
-	console.log(
-		`${"JOB ID".padEnd(36)}  ${"STATUS".padEnd(12)}  ${"CREATED".padEnd(20)}`,
-	);
-	console.log(
-		`${"------".padEnd(36)}  ${"------".padEnd(12)}  ${"-------".padEnd(20)}`,
-	);
+	// Build the whole table and emit it with a single write rather than a
+	// console.log per row
+	const lines: string[] = [
+		`\nJobs (showing up to ${limit}, total: ${jobs.length}):`,
+		"=".repeat(80),
+		JOB_LIST_HEADER,
+		JOB_LIST_SEPARATOR,
+	];
 
 	for (const job of jobs) {
-		console.log(
+		lines.push(
 			`${job.jobId.padEnd(36)}  ${job.status.padEnd(12)}  ${formatDateTime(job.createdAt).padEnd(20)}`,
 		);
 	}
-	console.log();
+	lines.push("");
+	console.log(lines.join("\n"));
 }
 
 export function printJobStatus(
@@ -352,12 +352,22 @@ export function getTimestamp(): string {
  */
 export async function findLatestLog(prefix: string): Promise<string | null> {
 	try {
-		const result =
-			await $`ls -t ${LOGS_DIR}/${prefix}_*.log 2>/dev/null | head -1`
-				.quiet()
-				.text();
-		const logFile = result.trim();
-		return logFile || null;
+		// Single pass over matching logs, tracking the newest mtime — avoids
+		// spawning `ls -t | head -1` and sorting every entry just to take one
+		const glob = new Bun.Glob(`${prefix}_*.log`);
+		let latestLog: string | null = null;
+		let latestMtimeMs = -1;
+
+		for (const name of glob.scanSync({ cwd: LOGS_DIR })) {
+			const logPath = join(LOGS_DIR, name);
+			const mtimeMs = Bun.file(logPath).lastModified;
+			if (mtimeMs > latestMtimeMs) {
+				latestMtimeMs = mtimeMs;
+				latestLog = logPath;
+			}
+		}
+
+		return latestLog;
 	} catch {
 		return null;
 	}
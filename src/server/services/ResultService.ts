@@ -197,37 +197,24 @@ export class ResultService {
 							cacheReadCost?: number;
 						}
 
-						const inputCost =
-							data.sessions?.reduce(
-								(sum: number, sess: { costs?: SessionCosts }) =>
-									sum + (sess.costs?.input_cost ?? sess.costs?.inputCost ?? 0),
-								0,
-							) || 0;
-						const outputCost =
-							data.sessions?.reduce(
-								(sum: number, sess: { costs?: SessionCosts }) =>
-									sum +
-									(sess.costs?.output_cost ?? sess.costs?.outputCost ?? 0),
-								0,
-							) || 0;
-						const cacheCreationCost =
-							data.sessions?.reduce(
-								(sum: number, sess: { costs?: SessionCosts }) =>
-									sum +
-									(sess.costs?.cache_creation_cost ??
-										sess.costs?.cacheCreationCost ??
-										0),
-								0,
-							) || 0;
-						const cacheReadCost =
-							data.sessions?.reduce(
-								(sum: number, sess: { costs?: SessionCosts }) =>
-									sum +
-									(sess.costs?.cache_read_cost ??
-										sess.costs?.cacheReadCost ??
-										0),
-								0,
-							) || 0;
+						// Accumulate all four cost components in one pass over the
+						// sessions instead of reducing the list once per component,
+						// resolving each session's costs object a single time
+						let inputCost = 0;
+						let outputCost = 0;
+						let cacheCreationCost = 0;
+						let cacheReadCost = 0;
+						for (const sess of (data.sessions ?? []) as Array<{
+							costs?: SessionCosts;
+						}>) {
+							const c = sess.costs;
+							if (!c) continue;
+							inputCost += c.input_cost ?? c.inputCost ?? 0;
+							outputCost += c.output_cost ?? c.outputCost ?? 0;
+							cacheCreationCost +=
+								c.cache_creation_cost ?? c.cacheCreationCost ?? 0;
+							cacheReadCost += c.cache_read_cost ?? c.cacheReadCost ?? 0;
+						}
 
 						return {
 							total_input_tokens: inputTokens,